@@ -41,7 +41,7 @@ except ImportError as e:
 
 # Import our modules after env variables are loaded
 try:
-    from browser_use_ui.ui.ui_builder import UIBuilder, THEME_MAP
+    from browser_use_ui.ui.ui_builder import UIBuilder, THEME_NAMES
 except ImportError as e:
     print(f"ERROR: Failed to import UI modules: {e}")
     print("Please ensure all dependencies are installed by running:")
@@ -54,19 +54,35 @@ def main():
     # Parse command-line arguments
     parser = argparse.ArgumentParser(description="Gradio UI for Browser Agent")
     parser.add_argument("--ip", type=str, default="127.0.0.1", help="IP address to bind to")
-    parser.add_argument("--port", type=str, default="7788", help="Port to listen on")
+    parser.add_argument("--port", type=int, default=7788, help="Port to listen on")
     parser.add_argument(
         "--theme", 
         type=str, 
         default="Ocean", 
-        choices=THEME_MAP.keys(), 
+        choices=THEME_NAMES, 
         help="Theme to use for the UI"
     )
+    parser.add_argument(
+        "--browser-pool-size",
+        type=int,
+        default=0,
+        help="Number of browsers to keep launched between runs (0 to disable)"
+    )
+    parser.add_argument(
+        "--llm-cache-size",
+        type=int,
+        default=0,
+        help="Number of LLM responses to cache for temperature 0 models (0 to disable)"
+    )
     args = parser.parse_args()
     
     # Create and launch the UI
-    ui_builder = UIBuilder(theme_name=args.theme)
-    ui_builder.launch(server_name=args.ip, server_port=int(args.port))
+    ui_builder = UIBuilder(
+        theme_name=args.theme,
+        browser_pool_size=args.browser_pool_size,
+        llm_cache_size=args.llm_cache_size
+    )
+    ui_builder.launch(server_name=args.ip, server_port=args.port)
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
@@ -1,11 +1,28 @@
 import os
 import json
 import logging
+from pathlib import Path
+
 import gradio as gr
 from typing import Dict, Any, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Use orjson for config files when it's installed, it's considerably faster
+# than the json module for indented output
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    _loads = json.loads
+
 class ComponentManager:
     """
     Manages UI components for persistence and configuration.
@@ -14,6 +31,8 @@ class ComponentManager:
     
     def __init__(self):
         self.components = {}
+        # Registered components that have a value to load config into
+        self._settable: Dict[str, gr.components.Component] = {}
         
     def register_component(self, name: str, component: gr.components.Component) -> None:
         """
@@ -27,6 +46,10 @@ class ComponentManager:
             logger.warning(f"Component {name} already registered, overwriting")
             
         self.components[name] = component
+        if hasattr(component, "value"):
+            self._settable[name] = component
+        else:
+            self._settable.pop(name, None)
         logger.debug(f"Registered component: {name}")
         
     def get_component(self, name: str) -> Optional[gr.components.Component]:
@@ -78,8 +101,7 @@ class ComponentManager:
             timestamp = int(time.time())
             filename = f"configs/ui_config_{timestamp}.json"
             
-            with open(filename, "w") as f:
-                json.dump(config, f, indent=2)
+            Path(filename).write_bytes(_dumps(config))
                 
             return {"status": "success", "message": f"Config saved to {filename}", "config": filename}
         except Exception as e:
@@ -105,19 +127,20 @@ class ComponentManager:
                 return {"status": "error", "message": f"Config file not found: {file_path}"}
                 
             # Load config
-            with open(file_path, "r") as f:
-                config = json.load(f)
+            config = _loads(Path(file_path).read_bytes())
                 
             # Update component values
             updated = 0
+            settable = self._settable
             for name, value in config.items():
-                component = self.get_component(name)
-                if component and hasattr(component, "value"):
-                    try:
-                        component.value = value
-                        updated += 1
-                    except Exception as e:
-                        logger.warning(f"Could not update component {name}: {e}")
+                component = settable.get(name)
+                if component is None:
+                    continue
+                try:
+                    component.value = value
+                    updated += 1
+                except Exception as e:
+                    logger.warning(f"Could not update component {name}: {e}")
                         
             return {
                 "status": "success", 
@@ -138,29 +161,30 @@ def scan_and_register_components(blocks: gr.Blocks, component_manager: Component
     Returns:
         Number of components registered
     """
-    def traverse_blocks(block, prefix=""):
-        registered = 0
-
-        # Process block's components
-        if hasattr(block, "children"):
-            for i, child in enumerate(block.children):
-                if isinstance(child, gr.components.Component):
-                    # Skip buttons
-                    if getattr(child, "interactive", False) and not isinstance(child, gr.Button):
-                        name = f"{prefix}component_{i}"
-                        if hasattr(child, "label") and child.label:
-                            # Use label as part of the name
-                            label = child.label
-                            name = f"{prefix}{label}"
-                        component_manager.register_component(name, child)
-                        registered += 1
-                elif hasattr(child, "children"):
-                    # Recursively process nested Blocks
-                    new_prefix = f"{prefix}block_{i}_"
-                    registered += traverse_blocks(child, new_prefix)
-
-        return registered
+    # Gradio keeps every rendered block in creation order, so each layout
+    # block comes before its children; names still encode the layout path
+    component_cls, button_cls = gr.components.Component, gr.Button
+    register = component_manager.register_component
+    prefixes = {id(blocks): ""}
+    # Position of each block within its parent's children
+    positions = {id(child): i for i, child in enumerate(getattr(blocks, "children", ()))}
+    total = 0
+    for block in blocks.blocks.values():
+        prefix = prefixes.get(id(getattr(block, "parent", None)))
+        if prefix is None:
+            # Not part of this layout
+            continue
+        i = positions[id(block)]
+        if isinstance(block, component_cls):
+            # Skip buttons
+            if getattr(block, "interactive", False) and not isinstance(block, button_cls):
+                # Use label as part of the name
+                label = getattr(block, "label", None)
+                register(f"{prefix}{label}" if label else f"{prefix}component_{i}", block)
+                total += 1
+        elif hasattr(block, "children"):
+            prefixes[id(block)] = f"{prefix}block_{i}_"
+            positions.update((id(child), j) for j, child in enumerate(block.children))
 
-    total = traverse_blocks(blocks)
     logger.info(f"Total registered components: {total}")
     return total 
\ No newline at end of file
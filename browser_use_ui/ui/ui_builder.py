@@ -1,22 +1,124 @@
+import asyncio
 import logging
+from functools import lru_cache
 import gradio as gr
-from typing import Dict, Any, Optional
+import uvicorn
+from fastapi import FastAPI, Response
+from typing import Dict, Any, Optional, Tuple
 
-from browser_use_ui.ui.handlers import UIHandlers
+from browser_use_ui.ui.handlers import UIHandlers, STREAM_FRAME_ROUTE
+from browser_use_ui.ui.throttle import throttle_updates
 from browser_use_ui.ui.component_manager import ComponentManager, scan_and_register_components
-from browser_use_ui.utils.llm_utils import update_model_dropdown, MODEL_NAMES
-from browser_use_ui.utils.file_utils import list_recordings, get_latest_files, capture_screenshot
+from browser_use_ui.utils.llm_utils import update_model_dropdown, close_http_clients, MODEL_NAMES, PROVIDERS
+from browser_use_ui.utils.file_utils import list_recordings
 
 logger = logging.getLogger(__name__)
 
-# Define theme mapping for UI
-THEME_MAP = {
+# Define theme mapping for UI; themes are only instantiated when used
+_THEME_FACTORIES = {
     "Ocean": gr.themes.Ocean,
     "Monochrome": gr.themes.Monochrome,
     "Soft": gr.themes.Soft,
     "Glass": gr.themes.Glass,
     "Default": gr.themes.Default
 }
+THEME_NAMES = tuple(_THEME_FACTORIES)
+
+@lru_cache(maxsize=None)
+def _get_theme(name: str) -> gr.themes.Base:
+    """Get the theme with a given name, falling back to Ocean"""
+    return _THEME_FACTORIES.get(name, gr.themes.Ocean)()
+
+# Custom CSS for the UI
+_CSS = """
+body, .gradio-container {
+    background-color: #000000 !important;
+    color: #ffffff !important;
+}
+
+.gradio-container {
+    width: 60vw !important; 
+    max-width: 60% !important; 
+    margin-left: auto !important;
+    margin-right: auto !important;
+    padding-top: 20px !important;
+}
+
+/* Header styling */
+.header-text {
+    text-align: center;
+    margin-bottom: 30px;
+    background-color: #000000 !important;
+    color: #ffffff !important;
+    padding: 20px !important;
+    border-radius: 8px !important;
+    border: 1px solid #333333 !important;
+}
+
+.header-text h1 {
+    color: #ffffff !important;
+    margin-bottom: 10px !important;
+}
+
+.header-text h3 {
+    color: #ffffff !important;
+}
+
+/* Tab styling */
+.tabs {
+    background-color: #111111 !important;
+    border-radius: 8px !important;
+}
+
+/* Input fields styling */
+input, textarea, select, .gr-box, .gr-form, .gr-panel {
+    background-color: #111111 !important;
+    color: #ffffff !important;
+    border: 1px solid #333333 !important;
+}
+
+/* Button styling */
+button {
+    background-color: #222222 !important;
+    color: #ffffff !important;
+    border: 1px solid #444444 !important;
+}
+
+button:hover {
+    background-color: #333333 !important;
+}
+
+/* Label styling */
+label {
+    color: #ffffff !important;
+}
+
+/* General text */
+p, h1, h2, h3, h4, span {
+    color: #ffffff !important;
+}
+
+.theme-section {
+    margin-bottom: 20px;
+    padding: 15px;
+    border-radius: 10px;
+    background-color: #111111 !important;
+}
+"""
+
+_HEADER_MD = """
+# 🌐 CUA (Computer Use Agent)
+### Control your browser with AI assistance
+"""
+
+# Recurring visibility/interactivity updates, shared since they carry no value
+_CTX_VISIBLE = gr.update(visible=True)
+_CTX_HIDDEN = gr.update(visible=False)
+_INPUT_ENABLED = gr.update(interactive=True)
+_INPUT_DISABLED = gr.update(interactive=False)
+
+# Shown in the live browser view until the first frame arrives
+_BROWSER_PLACEHOLDER_HTML = "<h1 style='width:80vw; height:50vh'>Waiting for browser session...</h1>"
 
 class UIBuilder:
     """
@@ -29,89 +131,18 @@ class UIBuilder:
         component_manager: Manager for UI components and configuration
     """
     
-    def __init__(self, theme_name: str = "Ocean"):
+    def __init__(self, theme_name: str = "Ocean", browser_pool_size: int = 0, llm_cache_size: int = 0):
         self.theme_name = theme_name
         self.demo = None
-        self.ui_handlers = UIHandlers()
+        self.ui_handlers = UIHandlers(browser_pool_size=browser_pool_size, llm_cache_size=llm_cache_size)
         self.component_manager = ComponentManager()
-        
-    def _get_custom_css(self) -> str:
-        """Get custom CSS for the UI"""
-        return """
-        body, .gradio-container {
-            background-color: #000000 !important;
-            color: #ffffff !important;
-        }
-        
-        .gradio-container {
-            width: 60vw !important; 
-            max-width: 60% !important; 
-            margin-left: auto !important;
-            margin-right: auto !important;
-            padding-top: 20px !important;
-        }
-        
-        /* Header styling */
-        .header-text {
-            text-align: center;
-            margin-bottom: 30px;
-            background-color: #000000 !important;
-            color: #ffffff !important;
-            padding: 20px !important;
-            border-radius: 8px !important;
-            border: 1px solid #333333 !important;
-        }
-        
-        .header-text h1 {
-            color: #ffffff !important;
-            margin-bottom: 10px !important;
-        }
-        
-        .header-text h3 {
-            color: #ffffff !important;
-        }
-        
-        /* Tab styling */
-        .tabs {
-            background-color: #111111 !important;
-            border-radius: 8px !important;
-        }
-        
-        /* Input fields styling */
-        input, textarea, select, .gr-box, .gr-form, .gr-panel {
-            background-color: #111111 !important;
-            color: #ffffff !important;
-            border: 1px solid #333333 !important;
-        }
-        
-        /* Button styling */
-        button {
-            background-color: #222222 !important;
-            color: #ffffff !important;
-            border: 1px solid #444444 !important;
-        }
-        
-        button:hover {
-            background-color: #333333 !important;
-        }
-        
-        /* Label styling */
-        label {
-            color: #ffffff !important;
-        }
-        
-        /* General text */
-        p, h1, h2, h3, h4, span {
-            color: #ffffff !important;
-        }
-        
-        .theme-section {
-            margin-bottom: 20px;
-            padding: 15px;
-            border-radius: 10px;
-            background-color: #111111 !important;
-        }
-        """
+        # Components passed to and updated by an agent run, set by build_ui
+        self._run_inputs: Tuple[gr.components.Component, ...] = ()
+        self._run_outputs: Tuple[gr.components.Component, ...] = ()
+        # Default browser settings, set by build_ui, and the startup task
+        # pre-launching pooled browsers for them
+        self._default_browser_settings: Optional[Dict[str, Any]] = None
+        self._prewarm_task: Optional[asyncio.Task] = None
         
     def build_ui(self) -> gr.Blocks:
         """
@@ -120,24 +151,15 @@ class UIBuilder:
         Returns:
             A configured Gradio Blocks instance
         """
-        theme_class = THEME_MAP.get(self.theme_name, gr.themes.Ocean)
-        theme = theme_class()
-        
         self.demo = gr.Blocks(
             title="CUA - Computer Use Agent",
-            theme=theme,
-            css=self._get_custom_css()
+            theme=_get_theme(self.theme_name),
+            css=_CSS
         )
         
         with self.demo:
             with gr.Row():
-                gr.Markdown(
-                    """
-                    # 🌐 CUA (Computer Use Agent)
-                    ### Control your browser with AI assistance
-                    """,
-                    elem_classes=["header-text"],
-                )
+                gr.Markdown(_HEADER_MD, elem_classes=["header-text"])
 
             with gr.Tabs() as tabs:
                 # Tab 1: Agent Settings
@@ -196,7 +218,7 @@ class UIBuilder:
                 with gr.TabItem("🔧 LLM Settings", id=2):
                     with gr.Group():
                         llm_provider = gr.Dropdown(
-                            choices=[provider for provider in MODEL_NAMES.keys()],
+                            choices=list(PROVIDERS),
                             label="LLM Provider",
                             value="openai",
                             info="Select your preferred language model provider",
@@ -348,7 +370,7 @@ class UIBuilder:
 
                     with gr.Row():
                         browser_view = gr.HTML(
-                            value="<h1 style='width:80vw; height:50vh'>Waiting for browser session...</h1>",
+                            value=_BROWSER_PLACEHOLDER_HTML,
                             label="Live Browser View",
                             visible=False
                         )
@@ -377,15 +399,33 @@ class UIBuilder:
                     agent_history_file = gr.File(label="Agent History")
 
                 # Tab 5: Recordings
-                with gr.TabItem("🎥 Recordings", id=7, visible=True):
+                with gr.TabItem("🎥 Recordings", id=7, visible=True) as recordings_tab:
                     recordings_gallery = gr.Gallery(
                         label="Recordings",
                         columns=3,
                         height="auto",
                         object_fit="contain"
                     )
+                    # Whether this session's gallery has been filled yet
+                    recordings_loaded = gr.State(False)
 
-                    refresh_button = gr.Button("🔄 Refresh Recordings", variant="secondary")
+                    with gr.Row():
+                        refresh_button = gr.Button("🔄 Refresh Recordings", variant="secondary")
+                        recordings_page = gr.Number(
+                            label="Page",
+                            value=0,
+                            minimum=0,
+                            precision=0,
+                            interactive=True
+                        )
+                        recordings_page_size = gr.Slider(
+                            minimum=12,
+                            maximum=96,
+                            value=24,
+                            step=12,
+                            label="Recordings per Page",
+                            interactive=True
+                        )
 
                 # Tab 6: UI Configuration
                 with gr.TabItem("📁 UI Configuration", id=8):
@@ -405,30 +445,21 @@ class UIBuilder:
                     )
 
             # Event handlers
-            def update_ctx_visibility(provider):
-                return gr.update(visible=provider == "ollama")
+            async def on_provider_change(provider, api_key, base_url):
+                # Context length only applies to Ollama
+                ctx_update = _CTX_VISIBLE if provider == "ollama" else _CTX_HIDDEN
+                return ctx_update, await update_model_dropdown(provider, api_key, base_url)
 
-            # Bind the change event of llm_provider
+            # Update context visibility and models in one round trip when provider changes
             llm_provider.change(
-                fn=update_ctx_visibility,
-                inputs=llm_provider,
-                outputs=ollama_num_ctx
-            )
-
-            # Update models when provider changes
-            llm_provider.change(
-                fn=lambda provider, api_key, base_url: update_model_dropdown(
-                    provider=provider, 
-                    api_key=api_key, 
-                    base_url=base_url
-                ),
+                fn=on_provider_change,
                 inputs=[llm_provider, llm_api_key, llm_base_url],
-                outputs=llm_model_name
+                outputs=[ollama_num_ctx, llm_model_name]
             )
 
             # Enable/disable recording path based on recording checkbox
             enable_recording.change(
-                fn=lambda enabled: gr.update(interactive=enabled),
+                fn=lambda enabled: _INPUT_ENABLED if enabled else _INPUT_DISABLED,
                 inputs=enable_recording,
                 outputs=save_recording_path
             )
@@ -438,18 +469,21 @@ class UIBuilder:
             keep_browser_open.change(fn=self.ui_handlers.close_browser)
 
             # Run and stop buttons
+            # Inputs are in AgentRunSpec field order
+            self._run_inputs = (
+                agent_type, llm_provider, llm_model_name, ollama_num_ctx, llm_temperature, llm_base_url,
+                llm_api_key, use_own_browser, keep_browser_open, headless, disable_security, window_w, window_h,
+                save_recording_path, save_agent_history_path, save_trace_path, enable_recording, task, add_infos, 
+                max_steps, use_vision, max_actions_per_step, tool_calling_method, chrome_cdp, max_input_tokens
+            )
+            self._run_outputs = (
+                browser_view, final_result_output, errors_output, model_actions_output, model_thoughts_output,
+                recording_gif, trace_file, agent_history_file, stop_button, run_button
+            )
             run_button.click(
-                fn=self.ui_handlers.run_with_stream,
-                inputs=[
-                    agent_type, llm_provider, llm_model_name, ollama_num_ctx, llm_temperature, llm_base_url,
-                    llm_api_key, use_own_browser, keep_browser_open, headless, disable_security, window_w, window_h,
-                    save_recording_path, save_agent_history_path, save_trace_path, enable_recording, task, add_infos, 
-                    max_steps, use_vision, max_actions_per_step, tool_calling_method, chrome_cdp, max_input_tokens
-                ],
-                outputs=[
-                    browser_view, final_result_output, errors_output, model_actions_output, model_thoughts_output,
-                    recording_gif, trace_file, agent_history_file, stop_button, run_button
-                ],
+                fn=throttle_updates(self.ui_handlers.run_from_inputs),
+                inputs=self._run_inputs,
+                outputs=self._run_outputs,
             )
 
             stop_button.click(
@@ -458,12 +492,19 @@ class UIBuilder:
                 outputs=[stop_button, run_button],
             )
 
-            # Recordings gallery
-            refresh_button.click(
-                fn=list_recordings,
-                inputs=save_recording_path,
-                outputs=recordings_gallery
+            # Recordings gallery, filled when the tab is first opened
+            recordings_inputs = [save_recording_path, recordings_page, recordings_page_size]
+            recordings_tab.select(
+                fn=self._load_recordings_once,
+                inputs=[recordings_loaded, *recordings_inputs],
+                outputs=[recordings_gallery, recordings_loaded]
             )
+            for trigger in (refresh_button.click, recordings_page.change, recordings_page_size.change):
+                trigger(
+                    fn=list_recordings,
+                    inputs=recordings_inputs,
+                    outputs=recordings_gallery
+                )
 
             # Config management
             save_config_button.click(
@@ -481,12 +522,58 @@ class UIBuilder:
             # Register components for configuration management
             scan_and_register_components(self.demo, self.component_manager)
 
+            # Browser settings used to pre-launch pooled browsers
+            self._default_browser_settings = dict(
+                agent_type=agent_type.value,
+                use_own_browser=use_own_browser.value,
+                headless=headless.value,
+                disable_security=disable_security.value,
+                window_w=window_w.value,
+                window_h=window_h.value,
+                chrome_cdp=chrome_cdp.value
+            )
+
         return self.demo
         
+    @staticmethod
+    def _load_recordings_once(loaded: bool, save_recording_path: str, page: int, page_size: int):
+        """
+        List recordings for the gallery the first time the Recordings tab is opened.
+        
+        The loaded flag is kept per session, so each browser session fills its
+        own gallery. Later visits keep the gallery as is; the refresh button
+        reloads it.
+        """
+        if loaded:
+            return gr.skip(), gr.skip()
+        return list_recordings(save_recording_path, page, page_size), True
+        
+    def _stream_frame(self) -> Response:
+        """Serve the latest streamed browser frame as raw image bytes"""
+        browser_manager = self.ui_handlers.browser_manager
+        frame = browser_manager.last_frame
+        if frame is None:
+            return Response(status_code=204)
+        return Response(
+            content=frame,
+            media_type=browser_manager.frame_media_type,
+            headers={"Cache-Control": "no-store"}
+        )
+        
+    async def _prewarm_browsers(self) -> None:
+        """Pre-launch pooled browsers for the default settings in the background"""
+        if self._default_browser_settings and self.ui_handlers.browser_manager.browser_pool.size > 0:
+            self._prewarm_task = asyncio.create_task(
+                self.ui_handlers.prewarm_browser(**self._default_browser_settings)
+            )
+        
     def launch(self, server_name: str = "127.0.0.1", server_port: int = 7788) -> None:
         """
         Launch the UI server.
         
+        The Gradio app is mounted on a FastAPI app that also serves the live
+        browser frames, so the stream doesn't have to inline them as base64.
+        
         Args:
             server_name: Server hostname
             server_port: Server port
@@ -494,4 +581,10 @@ class UIBuilder:
         if self.demo is None:
             self.build_ui()
             
-        self.demo.launch(server_name=server_name, server_port=server_port) 
\ No newline at end of file
+        app = FastAPI()
+        app.add_api_route(STREAM_FRAME_ROUTE, self._stream_frame, methods=["GET"])
+        app.add_event_handler("startup", self._prewarm_browsers)
+        app.add_event_handler("shutdown", self.ui_handlers.browser_manager.browser_pool.close)
+        app.add_event_handler("shutdown", close_http_clients)
+        app = gr.mount_gradio_app(app, self.demo, path="/")
+        uvicorn.run(app, host=server_name, port=server_port) 
\ No newline at end of file
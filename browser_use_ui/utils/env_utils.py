@@ -1,9 +1,30 @@
 import os
 import re
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# $SENSITIVE_* placeholders; the group is the environment variable name
+_SENSITIVE_RE = re.compile(r'\$(SENSITIVE_[A-Za-z0-9_]*)')
+
+@lru_cache(maxsize=256)
+def _resolve(name):
+    """
+    Get the value of a sensitive environment variable, cached per process.
+    
+    Unset variables raise KeyError, which lru_cache doesn't cache, so a
+    variable set later in the process is still picked up.
+    """
+    return os.environ[name]
+
+def _env_value(match):
+    """Get the value of a matched placeholder's variable, leaving unset ones as-is"""
+    try:
+        return _resolve(match.group(1))
+    except KeyError:
+        return match.group(0)
+
 def resolve_sensitive_env_variables(text):
     """
     Replace environment variable placeholders ($SENSITIVE_*) with their values.
@@ -12,16 +33,9 @@ def resolve_sensitive_env_variables(text):
     if not text:
         return text
 
-    # Find all $SENSITIVE_* patterns
-    env_vars = re.findall(r'\$SENSITIVE_[A-Za-z0-9_]*', text)
-
-    result = text
-    for var in env_vars:
-        # Remove the $ prefix to get the actual environment variable name
-        env_name = var[1:]  # removes the $
-        env_value = os.getenv(env_name)
-        if env_value is not None:
-            # Replace $SENSITIVE_VAR_NAME with its value
-            result = result.replace(var, env_value)
+    # Single pass, so the longest placeholder name always wins
+    # ($SENSITIVE_FOO_BAR isn't partially replaced by $SENSITIVE_FOO)
+    return _SENSITIVE_RE.sub(_env_value, text)
 
-    return result 
\ No newline at end of file
+# Values are cached once resolved; clear after changing them in os.environ
+resolve_sensitive_env_variables.cache_clear = _resolve.cache_clear
\ No newline at end of file
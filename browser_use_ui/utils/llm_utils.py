@@ -1,24 +1,61 @@
 import os
+import time
+import hashlib
 import logging
-from typing import Dict, Any, Optional, List, Union
+import importlib
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Dict, Any, Optional, List, Tuple, Union
 
-# Import LLM providers
-from langchain_ollama import ChatOllama
-from langchain.schema.language_model import BaseLanguageModel
-from browser_use_ui.utils.llm import DeepSeekR1ChatOllama
+# LLM providers are imported when a model is created, so importing this
+# module doesn't load langchain
+if TYPE_CHECKING:
+    from langchain.schema.language_model import BaseLanguageModel
 
 logger = logging.getLogger(__name__)
 
+# Provider classes that were previously imported here, resolved on first access
+_LAZY_ATTRS = {
+    "ChatOllama": ("langchain_ollama", "ChatOllama"),
+    "DeepSeekR1ChatOllama": ("browser_use_ui.utils.llm", "DeepSeekR1ChatOllama"),
+}
+
+def __getattr__(name: str) -> Any:
+    """Import provider classes on first access (PEP 562)"""
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _LAZY_ATTRS[name]
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
 # Define model names per provider
 MODEL_NAMES = {
-    "anthropic": ["claude-3-haiku-20240307", "claude-3-sonnet-20240229", "claude-3-opus-20240229"],
-    "openai": ["gpt-4o", "gpt-4-turbo", "gpt-4", "gpt-3.5-turbo"],
     "anthropic": ["claude-3-opus-20240229", "claude-3-sonnet-20240229", "claude-3-haiku-20240307"],
+    "openai": ["gpt-4o", "gpt-4-turbo", "gpt-4", "gpt-3.5-turbo"],
     "ollama": ["llama3", "llama2", "mistral", "mixtral", "phi3"],
     "google": ["gemini-pro", "gemini-pro-vision"],
     "mistral": ["mistral-large-latest", "mistral-medium-latest", "mistral-small-latest"]
 }
 
+# Supported providers, in display order
+PROVIDERS = tuple(MODEL_NAMES)
+
+# Maximum number of LLM clients kept for reuse
+LLM_CACHE_SIZE = 32
+
+# Cached LLM clients by configuration, least recently used first. Keys hold a
+# hash of the API key rather than the key itself.
+_llm_cache: "OrderedDict[Tuple, BaseLanguageModel]" = OrderedDict()
+
+# Seconds a fetched list of Ollama models is reused
+OLLAMA_TAGS_TTL = 30
+
+# Ollama model names by base URL, with the time they were fetched
+_ollama_tags: Dict[str, Tuple[float, List[str]]] = {}
+
+# HTTP client for Ollama requests, created on first use
+_ollama_client = None
+
 class MissingAPIKeyError(Exception):
     """Raised when an API key is required but not provided."""
     pass
@@ -30,10 +67,13 @@ def get_llm_model(
     num_ctx: int = 16000,
     base_url: Optional[str] = None,
     api_key: Optional[str] = None
-) -> BaseLanguageModel:
+) -> "BaseLanguageModel":
     """
     Get a language model based on the provider and model name.
     
+    Clients are cached per configuration, so repeated runs reuse the client
+    and its HTTP connections. Use evict_llm_models() to drop stale clients.
+    
     Args:
         provider: The LLM provider (openai, anthropic, ollama, etc.)
         model_name: The name of the model
@@ -57,81 +97,221 @@ def get_llm_model(
         logger.debug(f"Retrieving API key from environment: {env_var_name}")
         logger.debug(f"API key found in environment: {'Yes' if api_key else 'No'}")
     
-    # Handle providers
-    if provider == "openai":
-        from langchain_openai import ChatOpenAI
-        
-        if not api_key:
-            raise MissingAPIKeyError(
-                "OpenAI API key required. Please provide it through the UI or set OPENAI_API_KEY environment variable."
-            )
+    key_hash = hashlib.sha256(api_key.encode()).hexdigest() if api_key else None
+    cache_key = (provider, model_name, temperature, num_ctx, base_url, key_hash)
+    llm = _llm_cache.get(cache_key)
+    if llm is not None:
+        _llm_cache.move_to_end(cache_key)
+        return llm
         
-        logger.debug(f"Initializing ChatOpenAI with model: {model_name}")
+    llm = _create_llm_model(provider, model_name, temperature, num_ctx, base_url, api_key)
+    _llm_cache[cache_key] = llm
+    if len(_llm_cache) > LLM_CACHE_SIZE:
+        _llm_cache.popitem(last=False)
+    return llm
+
+def evict_llm_models(provider: Optional[str] = None) -> int:
+    """
+    Drop cached LLM clients, e.g. after rotating a provider's credentials.
+    
+    Args:
+        provider: Only drop clients of this provider (all if None)
         
-        return ChatOpenAI(
-            model=model_name,
-            temperature=temperature,
-            openai_api_key=api_key,
-            openai_api_base=base_url if base_url else None
-        )
+    Returns:
+        Number of clients dropped
+    """
+    keys = [key for key in _llm_cache if provider is None or key[0] == provider]
+    for key in keys:
+        del _llm_cache[key]
+    return len(keys)
+
+def _create_llm_model(
+    provider: str,
+    model_name: str,
+    temperature: float,
+    num_ctx: int,
+    base_url: Optional[str],
+    api_key: Optional[str]
+) -> "BaseLanguageModel":
+    """
+    Create a language model client.
     
-    elif provider == "anthropic":
-        from langchain_anthropic import ChatAnthropic
+    Called by get_llm_model on a cache miss, with the API key already
+    resolved from the environment.
+    
+    Args:
+        provider: The LLM provider
+        model_name: The name of the model
+        temperature: Model temperature (randomness)
+        num_ctx: Context length for Ollama models
+        base_url: Base URL for API (optional)
+        api_key: Resolved API key (optional)
         
-        if not api_key:
-            raise MissingAPIKeyError(
-                "Anthropic API key required. Please provide it through the UI or set ANTHROPIC_API_KEY environment variable."
-            )
-            
-        return ChatAnthropic(
-            model=model_name,
-            temperature=temperature,
-            anthropic_api_key=api_key,
-            anthropic_api_url=base_url if base_url else None
+    Returns:
+        An initialized LLM
+    """
+    try:
+        factory = _DISPATCH[provider]
+    except KeyError:
+        raise ValueError(f"Unsupported LLM provider: {provider}") from None
+    return factory(model_name, temperature, num_ctx, base_url, api_key)
+
+def _create_openai(
+    model_name: str,
+    temperature: float,
+    num_ctx: int,
+    base_url: Optional[str],
+    api_key: Optional[str]
+) -> "BaseLanguageModel":
+    """Create an OpenAI chat model"""
+    from langchain_openai import ChatOpenAI
+    
+    if not api_key:
+        raise MissingAPIKeyError(
+            "OpenAI API key required. Please provide it through the UI or set OPENAI_API_KEY environment variable."
         )
     
-    elif provider == "ollama":
-        # Ollama doesn't require API keys typically
-        return ChatOllama(
-            model=model_name,
-            temperature=temperature,
-            num_ctx=num_ctx,
-            base_url=base_url if base_url else "http://localhost:11434"
+    logger.debug(f"Initializing ChatOpenAI with model: {model_name}")
+    
+    return ChatOpenAI(
+        model=model_name,
+        temperature=temperature,
+        openai_api_key=api_key,
+        openai_api_base=base_url if base_url else None
+    )
+
+def _create_anthropic(
+    model_name: str,
+    temperature: float,
+    num_ctx: int,
+    base_url: Optional[str],
+    api_key: Optional[str]
+) -> "BaseLanguageModel":
+    """Create an Anthropic chat model"""
+    from langchain_anthropic import ChatAnthropic
+    
+    if not api_key:
+        raise MissingAPIKeyError(
+            "Anthropic API key required. Please provide it through the UI or set ANTHROPIC_API_KEY environment variable."
         )
+        
+    return ChatAnthropic(
+        model=model_name,
+        temperature=temperature,
+        anthropic_api_key=api_key,
+        anthropic_api_url=base_url if base_url else None
+    )
+
+def _create_ollama(
+    model_name: str,
+    temperature: float,
+    num_ctx: int,
+    base_url: Optional[str],
+    api_key: Optional[str]
+) -> "BaseLanguageModel":
+    """Create an Ollama chat model"""
+    from langchain_ollama import ChatOllama
+    
+    # Ollama doesn't require API keys typically
+    return ChatOllama(
+        model=model_name,
+        temperature=temperature,
+        num_ctx=num_ctx,
+        base_url=base_url if base_url else "http://localhost:11434"
+    )
+
+def _create_google(
+    model_name: str,
+    temperature: float,
+    num_ctx: int,
+    base_url: Optional[str],
+    api_key: Optional[str]
+) -> "BaseLanguageModel":
+    """Create a Google chat model"""
+    from langchain_google_genai import ChatGoogleGenerativeAI
     
-    elif provider == "google":
-        from langchain_google_genai import ChatGoogleGenerativeAI
+    if not api_key:
+        raise MissingAPIKeyError(
+            "Google API key required. Please provide it through the UI or set GOOGLE_API_KEY environment variable."
+        )
         
-        if not api_key:
-            raise MissingAPIKeyError(
-                "Google API key required. Please provide it through the UI or set GOOGLE_API_KEY environment variable."
-            )
-            
-        return ChatGoogleGenerativeAI(
-            model=model_name,
-            temperature=temperature,
-            google_api_key=api_key
+    return ChatGoogleGenerativeAI(
+        model=model_name,
+        temperature=temperature,
+        google_api_key=api_key
+    )
+
+def _create_mistral(
+    model_name: str,
+    temperature: float,
+    num_ctx: int,
+    base_url: Optional[str],
+    api_key: Optional[str]
+) -> "BaseLanguageModel":
+    """Create a Mistral chat model"""
+    from langchain_mistralai import ChatMistralAI
+    
+    if not api_key:
+        raise MissingAPIKeyError(
+            "Mistral API key required. Please provide it through the UI or set MISTRAL_API_KEY environment variable."
         )
+        
+    return ChatMistralAI(
+        model=model_name,
+        temperature=temperature,
+        mistral_api_key=api_key,
+        mistral_api_base=base_url if base_url else None
+    )
+
+# Model factories by provider, each importing its provider package on use
+_DISPATCH: Dict[str, Callable[..., "BaseLanguageModel"]] = {
+    "openai": _create_openai,
+    "anthropic": _create_anthropic,
+    "ollama": _create_ollama,
+    "google": _create_google,
+    "mistral": _create_mistral
+}
+
+async def _get_ollama_models(base_url: str) -> List[str]:
+    """
+    Get the models available on an Ollama server.
     
-    elif provider == "mistral":
-        from langchain_mistralai import ChatMistralAI
+    Results are reused for OLLAMA_TAGS_TTL seconds, and requests share an
+    async client so the connection to the server is kept alive and the
+    event loop isn't blocked while waiting.
+    
+    Args:
+        base_url: Base URL of the Ollama server
+        
+    Returns:
+        List of model names
+    """
+    global _ollama_client
+    cached = _ollama_tags.get(base_url)
+    if cached is not None and time.monotonic() - cached[0] < OLLAMA_TAGS_TTL:
+        return cached[1]
         
-        if not api_key:
-            raise MissingAPIKeyError(
-                "Mistral API key required. Please provide it through the UI or set MISTRAL_API_KEY environment variable."
-            )
-            
-        return ChatMistralAI(
-            model=model_name,
-            temperature=temperature,
-            mistral_api_key=api_key,
-            mistral_api_base=base_url if base_url else None
+    if _ollama_client is None:
+        import httpx
+        _ollama_client = httpx.AsyncClient(
+            timeout=2.0,
+            limits=httpx.Limits(max_keepalive_connections=4)
         )
-    
-    else:
-        raise ValueError(f"Unsupported LLM provider: {provider}")
+        
+    response = await _ollama_client.get(f"{base_url}/api/tags")
+    response.raise_for_status()
+    models = list(model["name"] for model in response.json()["models"])
+    _ollama_tags[base_url] = (time.monotonic(), models)
+    return models
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP clients, e.g. on application shutdown"""
+    global _ollama_client
+    if _ollama_client is not None:
+        await _ollama_client.aclose()
+        _ollama_client = None
 
-def update_model_dropdown(
+async def update_model_dropdown(
     provider: str, 
     api_key: Optional[str] = None, 
     base_url: Optional[str] = None
@@ -150,10 +330,7 @@ def update_model_dropdown(
     # For Ollama, try to get a list of models from the server
     if provider == "ollama" and base_url:
         try:
-            import requests
-            response = requests.get(f"{base_url}/api/tags")
-            if response.status_code == 200:
-                return [model["name"] for model in response.json()["models"]]
+            return await _get_ollama_models(base_url)
         except Exception as e:
             logger.warning(f"Failed to get Ollama models: {e}")
     
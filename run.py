@@ -7,65 +7,52 @@ This script is a wrapper to run the application with the appropriate environment
 
 import os
 import sys
-import subprocess
 from pathlib import Path
 
-def run_command(cmd, shell=False):
-    """Run a command and capture output"""
-    try:
-        result = subprocess.run(
-            cmd, 
-            shell=shell, 
-            check=True, 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.STDOUT,
-            text=True
-        )
-        return result.returncode, result.stdout
-    except subprocess.CalledProcessError as e:
-        return e.returncode, e.output
+# Project directory and entry points, resolved once
+_ROOT = Path(__file__).resolve().parent
+_RUN_SCRIPT = _ROOT / "scripts" / "run_app.sh"
+_APP = _ROOT / "browser_use_app.py"
+
+# Whether we're running in a virtual environment
+_IN_VENV = hasattr(sys, 'real_prefix') or getattr(sys, 'base_prefix', sys.prefix) != sys.prefix
 
 def main():
     """Run the browser use app"""
-    # Get the current directory
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    
     # Change to the project directory
-    os.chdir(current_dir)
+    os.chdir(_ROOT)
     
-    # Set up environment with API keys
+    # Set up environment with API keys. Loaded into this process so that the
+    # app launched below inherits them.
     print("Setting up API keys from .env file...")
-    api_key_script = os.path.join(current_dir, "scripts", "set_api_keys.py")
-    if os.path.exists(api_key_script):
-        # Make the script executable if it's not already
-        if not os.access(api_key_script, os.X_OK):
-            os.chmod(api_key_script, 0o755)
-        
-        # Run the API key script
-        run_command([sys.executable, api_key_script])
-    
-    # Check if we're in a virtual environment
-    in_venv = hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix)
+    try:
+        from dotenv import load_dotenv
+        load_dotenv(_ROOT / ".env", override=False)
+    except ImportError:
+        print("python-dotenv is not installed; the app will load .env itself.")
     
     # Look for the shell script first
-    run_script = os.path.join(current_dir, "scripts", "run_app.sh")
-    
-    if os.path.exists(run_script):
-        # Make the script executable if it's not already
-        if not os.access(run_script, os.X_OK):
-            os.chmod(run_script, 0o755)
+    if _RUN_SCRIPT.is_file():
+        # Make sure the script is executable; a read-only mount can't be
+        # changed, and exec reports the problem if it really isn't executable
+        if not os.access(_RUN_SCRIPT, os.X_OK):
+            try:
+                os.chmod(_RUN_SCRIPT, 0o755)
+            except OSError:
+                pass
         
+        run_script = str(_RUN_SCRIPT)
         print(f"Running with script: {run_script}")
-        # Forward any arguments to the shell script
-        cmd = [run_script] + sys.argv[1:]
-        return_code = subprocess.call(cmd)
-        sys.exit(return_code)
+        # Replace this process with the shell script, forwarding any arguments
+        # Flush first, since exec discards Python's buffered output
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execv(run_script, [run_script] + sys.argv[1:])
     
     # If the shell script doesn't exist, try the app directly
-    app_script = os.path.join(current_dir, "browser_use_app.py")
-    
-    if os.path.exists(app_script):
-        if not in_venv:
+    if _APP.is_file():
+        app_script = str(_APP)
+        if not _IN_VENV:
             print("Using existing virtual environment.")
         
         print(f"Running application: {app_script}")
@@ -75,8 +62,10 @@ def main():
         else:
             cmd = [sys.executable, app_script] + sys.argv[1:]
         
-        return_code = subprocess.call(cmd)
-        sys.exit(return_code)
+        # Replace this process with the app
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execv(sys.executable, cmd)
     
     print("ERROR: Could not find application entry point.")
     print("Please ensure either 'scripts/run_app.sh' or 'browser_use_app.py' exists.")
@@ -0,0 +1,24 @@
+"""
+Shared logging setup for the helper scripts
+"""
+import sys
+import logging
+
+def setup(level: int = logging.INFO) -> None:
+    """
+    Configure root logging for a script, unless it's already configured.
+
+    Timestamps are only included when the script is run with --verbose.
+
+    Args:
+        level: Minimum level to log
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    fmt = '%(asctime)s - %(name)s - %(levelname)s - %(message)s' if '--verbose' in sys.argv else '%(levelname)s %(message)s'
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(fmt))
+    root.addHandler(handler)
+    root.setLevel(level)
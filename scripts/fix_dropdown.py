@@ -3,11 +3,14 @@
 Script to fix the UI dropdown issue by patching model names
 """
 import os
+import ast
 import logging
 from pathlib import Path
 
+import _log
+
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+_log.setup()
 logger = logging.getLogger(__name__)
 
 def main():
@@ -22,21 +25,37 @@ def main():
     with open(utils_file, 'r') as f:
         content = f.read()
     
-    # Extract the MODEL_NAMES definition
-    if 'MODEL_NAMES = {' not in content:
+    # Locate the MODEL_NAMES dictionary
+    model_names = next(
+        (
+            node.value for node in ast.parse(content).body
+            if isinstance(node, ast.Assign)
+            and any(isinstance(t, ast.Name) and t.id == 'MODEL_NAMES' for t in node.targets)
+            and isinstance(node.value, ast.Dict)
+        ),
+        None
+    )
+    if model_names is None:
         logger.error("Could not find MODEL_NAMES dictionary in the file")
         return
     
-    # Update the content to ensure anthropic models are properly defined
-    updated_content = content.replace(
-        'MODEL_NAMES = {',
-        '''MODEL_NAMES = {
-    "anthropic": ["claude-3-haiku-20240307", "claude-3-sonnet-20240229", "claude-3-opus-20240229"],'''
+    # Nothing to do if anthropic models are already defined, so repeated runs
+    # don't add duplicate keys
+    if any(isinstance(key, ast.Constant) and key.value == 'anthropic' for key in model_names.keys):
+        logger.info(f"{utils_file} already defines anthropic models")
+        return
+    
+    # Insert the anthropic entry right after the opening brace, leaving the
+    # rest of the file untouched
+    lines = content.splitlines(keepends=True)
+    lines.insert(
+        model_names.lineno,
+        '    "anthropic": ["claude-3-haiku-20240307", "claude-3-sonnet-20240229", "claude-3-opus-20240229"],\n'
     )
     
     # Write the updated content
     with open(utils_file, 'w') as f:
-        f.write(updated_content)
+        f.write(''.join(lines))
     
     logger.info(f"Updated {utils_file} with correct anthropic models")
     logger.info("Please restart the application for changes to take effect")
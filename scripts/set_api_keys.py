@@ -4,16 +4,52 @@ Script to set API keys from .env file
 """
 
 import os
+import re
 import sys
 import logging
 from pathlib import Path
+from typing import Dict, Iterable
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+import _log
+
+_log.setup()
 logger = logging.getLogger(__name__)
 
+# KEY=VALUE assignments, optionally prefixed with "export". Comment lines
+# never match since "#" can't start a key.
+_ASSIGNMENT = re.compile(rb'^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t]*\r?$', re.M)
+
+# Start of an unquoted value's trailing comment
+_COMMENT = re.compile(rb'[ \t]#')
+
+def _parse_value(raw: bytes) -> str:
+    """Decode an assigned value, removing surrounding quotes or a trailing comment"""
+    quote = raw[:1]
+    if quote in (b'"', b"'"):
+        # Anything after the closing quote is a comment
+        end = raw.find(quote, 1)
+        if end != -1:
+            return raw[1:end].decode()
+    return _COMMENT.split(raw, 1)[0].rstrip().decode()
+
+def read_assignments(data: bytes, keys: Iterable[str]) -> Dict[str, str]:
+    """
+    Scan .env contents for assignments in one pass, decoding only the given keys.
+    
+    Args:
+        data: Raw .env file contents
+        keys: Names of the variables to read
+        
+    Returns:
+        Dictionary of variable name to value
+    """
+    wanted = {key.encode() for key in keys}
+    return {
+        key.decode(): _parse_value(value)
+        for key, value in _ASSIGNMENT.findall(data)
+        if key in wanted
+    }
+
 def main():
     """Read API keys from .env and set them in the environment."""
     # Find the project root (location of .env file)
@@ -26,18 +62,6 @@ def main():
     
     logger.info(f"Reading API keys from {env_path}")
     
-    # Read .env file line by line
-    env_vars = {}
-    with open(env_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-                
-            if '=' in line:
-                key, value = line.split('=', 1)
-                env_vars[key] = value
-    
     # Set API keys in environment
     api_keys = [
         'OPENAI_API_KEY',
@@ -45,16 +69,20 @@ def main():
         'GOOGLE_API_KEY',
         'MISTRAL_API_KEY'
     ]
+    env_vars = read_assignments(env_path.read_bytes(), api_keys)
     
     # Export keys
+    found = {key: env_vars[key] for key in api_keys if env_vars.get(key)}
+    os.environ.update(found)
+    
+    # Print masked keys for security, only building them if INFO is logged
+    if logger.isEnabledFor(logging.INFO):
+        for key, value in found.items():
+            mask = f"{value[:5]}...{value[-5:]}" if len(value) > 10 else "***"
+            logger.info("Set %s=%s", key, mask)
     for key in api_keys:
-        if key in env_vars and env_vars[key]:
-            os.environ[key] = env_vars[key]
-            # Print masked key for security
-            masked_key = f"{env_vars[key][:5]}...{env_vars[key][-5:]}" if len(env_vars[key]) > 10 else "***"
-            logger.info(f"Set {key}={masked_key}")
-        else:
-            logger.warning(f"{key} not found or empty in .env file")
+        if key not in found:
+            logger.warning("%s not found or empty in .env file", key)
     
     logger.info("API keys set successfully")
     
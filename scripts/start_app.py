@@ -7,29 +7,32 @@ appropriate action.
 
 import os
 import sys
-import subprocess
+from pathlib import Path
 
-def is_in_virtualenv():
-    """Check if we're running in a virtual environment"""
-    return hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix)
+# Directory of this script and the app entry point, resolved once
+_ROOT = Path(__file__).resolve().parent
+_APP = _ROOT.parent / 'browser_use_app.py'
+
+# Whether we're running in a virtual environment
+_IN_VENV = hasattr(sys, 'real_prefix') or getattr(sys, 'base_prefix', sys.prefix) != sys.prefix
 
 def main():
     # Check if we're in the virtual environment
-    if is_in_virtualenv():
+    if _IN_VENV:
         print("Running in virtual environment, launching application directly...")
-        os.execv(sys.executable, [sys.executable, 'browser_use_app.py', '--ip', '127.0.0.1', '--port', '7788'])
+        # Flush first, since exec discards Python's buffered output
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execv(sys.executable, [sys.executable, str(_APP), '--ip', '127.0.0.1', '--port', '7788'])
     else:
         # We're not in the virtual environment, run the shell script instead
         print("Not in virtual environment. Running via shell script...")
-        script_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'run_app.sh')
-        
-        # Make sure the script is executable
-        try:
-            os.chmod(script_path, 0o755)  # rwxr-xr-x
-        except Exception as e:
-            print(f"Warning: couldn't set executable permission: {e}")
+        script_path = str(_ROOT / 'run_app.sh')
         
-        # Use os.execv to replace the current process with the shell script
+        # Use os.execv to replace the current process with the shell script.
+        # The script is run through bash, so it needn't be executable.
+        sys.stdout.flush()
+        sys.stderr.flush()
         os.execv('/bin/bash', ['/bin/bash', script_path])
 
 if __name__ == '__main__':
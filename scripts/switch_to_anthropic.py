@@ -7,10 +7,26 @@ import json
 import logging
 from pathlib import Path
 
+import _log
+
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+_log.setup()
 logger = logging.getLogger(__name__)
 
+# Prefer orjson when it's installed
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode()
+
+    _loads = json.loads
+
 def main():
     # Find config file locations
     config_dir = Path(os.path.expanduser("~/.browser_use"))
@@ -29,8 +45,7 @@ def main():
         }
     else:
         # Load existing config and modify it
-        with open(config_file, "r") as f:
-            config = json.load(f)
+        config = _loads(config_file.read_bytes())
         
         # Update provider settings
         config["llm_provider"] = "anthropic"
@@ -39,8 +54,7 @@ def main():
         config["llm_base_url"] = os.getenv("ANTHROPIC_ENDPOINT", "https://api.anthropic.com")
     
     # Save the updated config
-    with open(config_file, "w") as f:
-        json.dump(config, f, indent=2)
+    config_file.write_bytes(_dumps(config))
     
     logger.info(f"Updated config file at {config_file}")
     logger.info("Next time you run the application, load the config file from:")
@@ -475,4 +475,8 @@ class CustomAgent(Agent):
                 if isinstance(self.settings.generate_gif, str):
                     output_path = self.settings.generate_gif
 
-                create_history_gif(task=self.task, history=self.state.history, output_path=output_path)
+                # Decoding the step screenshots and encoding the GIF is CPU-bound,
+                # so keep it off the event loop that is still serving the UI
+                await asyncio.to_thread(
+                    create_history_gif, task=self.task, history=self.state.history, output_path=output_path
+                )
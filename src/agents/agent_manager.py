@@ -3,11 +3,9 @@ import logging
 import asyncio
 from typing import Dict, Any, Tuple, Optional, List, Union
 
-from browser_use.agent.service import Agent
-from src.agent.custom_agent import CustomAgent
+from langchain_core.caches import BaseCache
+from src.agents.llm_cache import InMemoryLRUCache, with_response_cache
 from src.browser.browser_manager import BrowserManager
-from src.controller.custom_controller import CustomController
-from src.agent.custom_prompts import CustomSystemPrompt, CustomAgentMessagePrompt
 from src.utils.agent_state import AgentState
 
 logger = logging.getLogger(__name__)
@@ -16,11 +14,15 @@ class AgentManager:
     """
     Manages agent lifecycle and execution, abstracting away the complexity
     of agent initialization and operation.
+    
+    Attributes:
+        response_cache: Cache answering repeated deterministic LLM calls (None to disable)
     """
     
-    def __init__(self):
+    def __init__(self, response_cache: Optional[BaseCache] = None):
         self.agent = None
         self.agent_state = AgentState()
+        self.response_cache = response_cache
         
     def get_agent_state(self) -> AgentState:
         """Get the current agent state"""
@@ -64,7 +66,13 @@ class AgentManager:
             max_input_tokens: Maximum input tokens
             add_infos: Additional information for the agent
         """
+        if self.response_cache is not None:
+            llm = with_response_cache(llm, self.response_cache)
+            
+        # Agent classes are imported on use, since only one type is needed per run
         if agent_type == "org":
+            from browser_use.agent.service import Agent
+            
             self.agent = Agent(
                 task=task,
                 llm=llm,
@@ -77,6 +85,10 @@ class AgentManager:
                 generate_gif=True
             )
         elif agent_type == "custom":
+            from src.agent.custom_agent import CustomAgent
+            from src.agent.custom_prompts import CustomSystemPrompt, CustomAgentMessagePrompt
+            from src.controller.custom_controller import CustomController
+            
             controller = CustomController()
             self.agent = CustomAgent(
                 task=task,
@@ -114,6 +126,10 @@ class AgentManager:
         try:
             history = await self.agent.run(max_steps=max_steps)
             
+            if isinstance(self.response_cache, InMemoryLRUCache):
+                stats = self.response_cache.stats
+                logger.info(f"LLM response cache: {stats['hits']} hits, {stats['misses']} misses")
+            
             return {
                 "final_result": history.final_result(),
                 "errors": history.errors(),
@@ -122,9 +138,9 @@ class AgentManager:
                 "agent_id": self.agent.state.agent_id
             }
         except Exception as e:
-            import traceback
-            error_msg = str(e) + "\n" + traceback.format_exc()
-            logger.error(f"Error running agent: {error_msg}")
+            # The full traceback goes to the log; the UI gets the short form
+            logger.exception("Error running agent")
+            error_msg = repr(e)
             return {
                 "final_result": "",
                 "errors": error_msg,
@@ -133,16 +149,23 @@ class AgentManager:
                 "agent_id": self.agent.state.agent_id if self.agent and hasattr(self.agent, "state") else None
             }
             
-    def save_history(self, save_path: str) -> Optional[str]:
+    async def save_history(self, save_path: str) -> Optional[str]:
         """
         Save the agent history to a file.
         
+        The history can be large, so it's written in a worker thread to keep
+        the event loop responsive.
+        
         Args:
             save_path: Directory to save the history to
             
         Returns:
             Path to the saved history file or None if unable to save
         """
+        return await asyncio.get_running_loop().run_in_executor(None, self._save_history_sync, save_path)
+        
+    def _save_history_sync(self, save_path: str) -> Optional[str]:
+        """Synchronous body of save_history()"""
         if not self.agent:
             return None
             
@@ -0,0 +1,83 @@
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from langchain_core.caches import BaseCache, RETURN_VAL_TYPE
+from langchain_core.language_models import BaseChatModel
+
+class InMemoryLRUCache(BaseCache):
+    """
+    LangChain response cache keeping the most recently used responses in memory.
+
+    LangChain looks responses up by the prompt and the model's serialized
+    settings (model name, temperature, bound tools), so only identical calls
+    hit. Both are hashed for the key, since agent prompts can carry large
+    base64 screenshots.
+
+    Attributes:
+        maxsize: Maximum number of cached responses
+        stats: Hit and miss counters
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+        self._entries: "OrderedDict[str, RETURN_VAL_TYPE]" = OrderedDict()
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        """Hash a prompt and model settings into a cache key"""
+        return hashlib.sha256(f"{llm_string}\0{prompt}".encode()).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Get the cached response for a prompt, if any"""
+        key = self._key(prompt, llm_string)
+        value = self._entries.get(key)
+        if value is None:
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return value
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Cache the response for a prompt, evicting the least recently used one if full"""
+        key = self._key(prompt, llm_string)
+        self._entries[key] = return_val
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self, **kwargs: Any) -> None:
+        """Drop all cached responses"""
+        self._entries.clear()
+
+    # The base class runs these in an executor, which only adds overhead for
+    # an in-memory lookup
+    async def alookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        return self.lookup(prompt, llm_string)
+
+    async def aupdate(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        self.update(prompt, llm_string, return_val)
+
+    async def aclear(self, **kwargs: Any) -> None:
+        self.clear()
+
+def with_response_cache(llm: Any, cache: BaseCache) -> Any:
+    """
+    Get a copy of a chat model that answers repeated calls from a cache.
+
+    Only deterministic (temperature 0) models are cached; sampling models
+    are returned unchanged since a repeated call is expected to differ.
+
+    Args:
+        llm: Language model to wrap
+        cache: LangChain cache to store responses in
+
+    Returns:
+        The cached model copy, or the original model if it isn't cacheable
+    """
+    if not isinstance(llm, BaseChatModel) or getattr(llm, "temperature", None) != 0:
+        return llm
+    # Shallow copy, so the copy shares the original's HTTP client
+    return llm.model_copy(update={"cache": cache})
@@ -1,51 +1,120 @@
 import os
+import base64
 import logging
 import asyncio
-from typing import Optional, List, Dict, Any
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Tuple, Callable
 
 from browser_use.browser.browser import Browser, BrowserConfig
 from browser_use.browser.context import (
     BrowserContextConfig,
     BrowserContextWindowSize
 )
+from src.browser.browser_pool import BrowserPool
 from src.browser.custom_browser import CustomBrowser
 from src.browser.custom_context import CustomBrowserContext
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of browser contexts kept open for reuse on the current browser
+CONTEXT_CACHE_SIZE = 4
+
+# Stream frame formats in order of preference; webp needs a recent Chromium
+FRAME_FORMATS = ("webp", "jpeg")
+
 class BrowserManager:
     """
     Manages browser instances and contexts to avoid global state
     and provide cleaner lifecycle management.
+    
+    Attributes:
+        browser_pool: Pool that browsers are acquired from and released to
     """
     
-    def __init__(self):
+    def __init__(self, browser_pool: Optional[BrowserPool] = None):
+        self.browser_pool = browser_pool or BrowserPool(size=0)
         self.browser = None
+        self._browser_key = None
         self.browser_context = None
+        self._context_cache: OrderedDict[Tuple, CustomBrowserContext] = OrderedDict()
+        self._primary_page = None
+        self._cdp_session = None
+        self._frame_format = None
+        self._last_frame_b64 = None
+        self._last_frame = None
+        self._last_frame_format = None
+        self._frame_version = 0
         
-    async def initialize_browser(
-        self, 
-        headless: bool, 
-        disable_security: bool, 
-        cdp_url: str = None, 
-        extra_chromium_args: List[str] = None,
-        use_own_browser: bool = False,
-        browser_type: str = "default"
-    ) -> None:
+    @property
+    def frame_version(self) -> int:
+        """Counter that only changes when the captured frame content changes"""
+        return self._frame_version
+        
+    @property
+    def frame_media_type(self) -> str:
+        """Media type of the captured frames"""
+        return f"image/{self._last_frame_format or FRAME_FORMATS[-1]}"
+        
+    @property
+    def last_frame(self) -> Optional[bytes]:
         """
-        Initialize a browser instance if one doesn't exist or if configuration has changed.
+        Raw image bytes of the most recently captured screenshot.
         
-        Args:
-            headless: Whether to run browser in headless mode
-            disable_security: Whether to disable browser security features
-            cdp_url: URL for Chrome DevTools Protocol
-            extra_chromium_args: Additional Chrome command line arguments
-            use_own_browser: Whether to use an existing browser instance
-            browser_type: Type of browser to use ("default" or "custom")
+        Frames arrive base64-encoded from CDP and are decoded at most once,
+        either ahead of time by prepare_frame() or when first read.
+        """
+        return self._decode_frame()
+        
+    def _decode_frame(self) -> Optional[bytes]:
+        """Decode the latest frame, reusing the result while the frame is unchanged"""
+        data = self._last_frame_b64
+        if data is None:
+            return None
+        decoded = self._last_frame
+        if decoded is None or decoded[0] is not data:
+            # Kept together with its source, so bytes decoded while a newer
+            # frame arrived are never served for that newer frame
+            decoded = (data, base64.b64decode(data))
+            self._last_frame = decoded
+        return decoded[1]
+        
+    def clear_frame(self) -> None:
+        """
+        Forget the last captured frame.
+        
+        Called when a new run starts rather than when the browser closes, so
+        the final frame of a run stays available to the UI after it ends.
+        """
+        self._last_frame_b64 = None
+        self._last_frame = None
+        self._last_frame_format = None
+        
+    async def prepare_frame(self) -> None:
+        """
+        Decode the latest frame in a worker thread ahead of the UI fetching it.
+        
+        Lets the decode overlap with the UI update round trip instead of
+        running when the frame is requested.
+        """
+        await asyncio.to_thread(self._decode_frame)
+        
+    def _browser_config(
+        self,
+        headless: bool,
+        disable_security: bool,
+        cdp_url: Optional[str],
+        extra_chromium_args: Optional[List[str]],
+        use_own_browser: bool,
+        browser_type: str
+    ) -> Tuple[Tuple, Callable[[], Browser]]:
+        """
+        Resolve browser settings into a pool key and a browser factory.
+        
+        Returns:
+            Tuple of (configuration key, callable creating the browser)
         """
         # Default extra args
-        if extra_chromium_args is None:
-            extra_chromium_args = []
+        extra_chromium_args = list(extra_chromium_args or [])
             
         # Handle Chrome path for own browser
         chrome_path = None
@@ -58,19 +127,10 @@ class BrowserManager:
             if chrome_user_data:
                 extra_chromium_args += [f"--user-data-dir={chrome_user_data}"]
                 
-        # Initialize browser based on type
-        if browser_type == "custom":
-            self.browser = CustomBrowser(
-                config=BrowserConfig(
-                    headless=headless,
-                    disable_security=disable_security,
-                    cdp_url=cdp_url,
-                    chrome_instance_path=chrome_path,
-                    extra_chromium_args=extra_chromium_args,
-                )
-            )
-        else:
-            self.browser = Browser(
+        browser_class = CustomBrowser if browser_type == "custom" else Browser
+        
+        def factory() -> Browser:
+            return browser_class(
                 config=BrowserConfig(
                     headless=headless,
                     disable_security=disable_security,
@@ -79,9 +139,68 @@ class BrowserManager:
                     extra_chromium_args=extra_chromium_args,
                 )
             )
+            
+        key = (headless, disable_security, cdp_url, chrome_path, tuple(extra_chromium_args), browser_type)
+        return key, factory
+        
+    async def initialize_browser(
+        self, 
+        headless: bool, 
+        disable_security: bool, 
+        cdp_url: str = None, 
+        extra_chromium_args: List[str] = None,
+        use_own_browser: bool = False,
+        browser_type: str = "default"
+    ) -> None:
+        """
+        Initialize a browser instance if one doesn't exist or if configuration has changed.
+        
+        Browsers are taken from the pool, so a pre-launched browser with the
+        same configuration is reused instead of starting a new one.
+        
+        Args:
+            headless: Whether to run browser in headless mode
+            disable_security: Whether to disable browser security features
+            cdp_url: URL for Chrome DevTools Protocol
+            extra_chromium_args: Additional Chrome command line arguments
+            use_own_browser: Whether to use an existing browser instance
+            browser_type: Type of browser to use ("default" or "custom")
+        """
+        key, factory = self._browser_config(
+            headless, disable_security, cdp_url, extra_chromium_args, use_own_browser, browser_type
+        )
+        
+        if self.browser is not None:
+            if key == self._browser_key:
+                logger.info(f"Reusing {browser_type} browser with headless={headless}")
+                return
+            await self._close_contexts()
+            await self.browser_pool.release(self.browser)
+            
+        self.browser = await self.browser_pool.acquire(key, factory)
+        self._browser_key = key
         
         logger.info(f"Initialized {browser_type} browser with headless={headless}")
         
+    async def prewarm_browser(
+        self, 
+        headless: bool, 
+        disable_security: bool, 
+        cdp_url: str = None, 
+        extra_chromium_args: List[str] = None,
+        use_own_browser: bool = False,
+        browser_type: str = "default"
+    ) -> None:
+        """
+        Pre-launch pooled browsers for the given configuration.
+        
+        Takes the same arguments as initialize_browser.
+        """
+        key, factory = self._browser_config(
+            headless, disable_security, cdp_url, extra_chromium_args, use_own_browser, browser_type
+        )
+        await self.browser_pool.prewarm(key, factory)
+        
     async def initialize_context(
         self,
         window_width: int,
@@ -92,6 +211,9 @@ class BrowserManager:
         """
         Initialize a browser context with specified configuration.
         
+        Contexts are cached per configuration for as long as the browser stays
+        open, so repeated runs keep their HTTP cache, cookies and service workers.
+        
         Args:
             window_width: Browser window width
             window_height: Browser window height
@@ -101,6 +223,14 @@ class BrowserManager:
         if self.browser is None:
             raise ValueError("Browser must be initialized before creating a context")
             
+        self._primary_page = None
+        key = (window_width, window_height, save_trace_path, save_recording_path)
+        if key in self._context_cache:
+            self._context_cache.move_to_end(key)
+            self.browser_context = self._context_cache[key]
+            logger.info(f"Reusing browser context with window size {window_width}x{window_height}")
+            return
+            
         self.browser_context = await self.browser.new_context(
             config=BrowserContextConfig(
                 trace_path=save_trace_path,
@@ -112,42 +242,115 @@ class BrowserManager:
                 ),
             )
         )
+        self._context_cache[key] = self.browser_context
+        
+        # Evict least recently used contexts beyond the cache size
+        while len(self._context_cache) > CONTEXT_CACHE_SIZE:
+            _, evicted = self._context_cache.popitem(last=False)
+            await evicted.close()
         
         logger.info(f"Initialized browser context with window size {window_width}x{window_height}")
         
+    async def _close_contexts(self) -> None:
+        """Close all cached contexts of the current browser"""
+        while self._context_cache:
+            _, context = self._context_cache.popitem()
+            await context.close()
+        self.browser_context = None
+        
     async def close_browser(self) -> None:
-        """Close the browser and context if they exist."""
-        if self.browser_context:
-            await self.browser_context.close()
-            self.browser_context = None
-            logger.info("Closed browser context")
+        """
+        Close the browser and its contexts if they exist.
+        
+        Contexts are always closed here, even when the pool keeps the browser
+        warm, since traces and recordings are only written out on context close.
+        """
+        self._primary_page = None
+        self._cdp_session = None
+        self._frame_format = None
+        
+        if self._context_cache:
+            await self._close_contexts()
+            logger.info("Closed browser contexts")
             
         if self.browser:
-            await self.browser.close()
+            await self.browser_pool.release(self.browser)
             self.browser = None
-            logger.info("Closed browser")
+            self._browser_key = None
+            logger.info("Released browser")
             
-    async def capture_screenshot(self) -> Optional[str]:
+    async def get_primary_page(self):
         """
-        Capture a screenshot of the current browser window.
+        Get the first page of the current browser context.
+        
+        The page handle is cached so that repeated callers (e.g. the stream loop)
+        don't pay a get_pages() round-trip per frame. The cache is dropped when
+        the page is closed or the context is replaced.
         
         Returns:
-            Base64-encoded screenshot or None if unable to capture
+            The first page or None if no page is available
         """
         if not self.browser_context:
             return None
             
-        try:
+        page = self._primary_page
+        if page is None or page.is_closed():
             pages = await self.browser_context.get_pages()
-            if not pages:
+            page = pages[0] if pages else None
+            self._primary_page = page
+            self._cdp_session = None
+            
+        return page
+            
+    async def capture_screenshot(self) -> Optional[str]:
+        """
+        Capture a screenshot of the current browser window.
+        
+        Uses Page.captureScreenshot on a CDP session attached to the primary
+        page, which skips Playwright's screenshot wrapper. WebP is tried first
+        and JPEG is used if the browser rejects it; the format that worked is
+        remembered for later frames. The frame is also kept as `last_frame`
+        so it can be served to the UI, and `frame_version` is bumped when its
+        content differs from the previous frame.
+        
+        Returns:
+            Base64-encoded screenshot or None if unable to capture
+        """
+        try:
+            page = await self.get_primary_page()
+            if page is None:
                 return None
                 
-            # Get the first page
-            page = pages[0]
-            screenshot_bytes = await page.screenshot(type="jpeg", quality=80)
-            
-            import base64
-            return base64.b64encode(screenshot_bytes).decode('utf-8')
+            if self._cdp_session is None:
+                self._cdp_session = await page.context.new_cdp_session(page)
         except Exception as e:
+            self._cdp_session = None
             logger.error(f"Error capturing screenshot: {e}")
-            return None 
\ No newline at end of file
+            return None
+            
+        formats = (self._frame_format,) if self._frame_format else FRAME_FORMATS
+        for frame_format in formats:
+            try:
+                response = await self._cdp_session.send(
+                    "Page.captureScreenshot",
+                    {"format": frame_format, "quality": 80, "captureBeyondViewport": False, "fromSurface": True}
+                )
+            except Exception as e:
+                error = e
+                continue
+                
+            self._frame_format = frame_format
+            
+            # Identical frames (e.g. an idle page) keep the current version and
+            # decoded bytes, so the UI has nothing new to fetch
+            data = response["data"]
+            if data != self._last_frame_b64:
+                self._last_frame_b64 = data
+                self._last_frame = None
+                self._last_frame_format = frame_format
+                self._frame_version += 1
+            return data
+            
+        self._cdp_session = None
+        logger.error(f"Error capturing screenshot: {error}")
+        return None
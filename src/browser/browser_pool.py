@@ -0,0 +1,111 @@
+import asyncio
+import logging
+from typing import Callable, Dict, Hashable
+
+from browser_use.browser.browser import Browser
+
+logger = logging.getLogger(__name__)
+
+class BrowserPool:
+    """
+    Keeps launched browsers warm between agent runs so that a run doesn't
+    pay the full Chromium startup cost.
+
+    Browsers are grouped by a configuration key; only a browser launched
+    with the same key is handed out again.
+
+    Attributes:
+        size: Maximum number of idle browsers kept per configuration key
+    """
+
+    def __init__(self, size: int = 1):
+        self.size = size
+        self._idle: Dict[Hashable, asyncio.Queue] = {}
+        self._keys: Dict[int, Hashable] = {}
+
+    def _queue(self, key: Hashable) -> asyncio.Queue:
+        """Get the idle queue for a configuration key"""
+        if key not in self._idle:
+            self._idle[key] = asyncio.Queue()
+        return self._idle[key]
+
+    async def _create(self, key: Hashable, factory: Callable[[], Browser]) -> Browser:
+        """
+        Create a browser without blocking the event loop.
+
+        The constructor does synchronous setup (config and argument handling),
+        so it runs in a worker thread.
+        """
+        browser = await asyncio.to_thread(factory)
+        self._keys[id(browser)] = key
+        return browser
+
+    async def _launch(self, key: Hashable, factory: Callable[[], Browser]) -> Browser:
+        """Create a browser and start its underlying Chromium process"""
+        browser = await self._create(key, factory)
+        await browser.get_playwright_browser()
+        return browser
+
+    async def prewarm(self, key: Hashable, factory: Callable[[], Browser]) -> None:
+        """
+        Launch browsers for a configuration until the pool is full.
+
+        Args:
+            key: Configuration key of the browsers
+            factory: Callable creating a new, not yet launched browser
+        """
+        queue = self._queue(key)
+        while queue.qsize() < self.size:
+            try:
+                queue.put_nowait(await self._launch(key, factory))
+            except Exception as e:
+                logger.warning(f"Failed to pre-launch browser: {e}")
+                return
+        logger.info(f"Browser pool warmed with {queue.qsize()} browser(s)")
+
+    async def acquire(self, key: Hashable, factory: Callable[[], Browser]) -> Browser:
+        """
+        Get a launched browser for a configuration.
+
+        Args:
+            key: Configuration key of the browser
+            factory: Callable creating a new browser if none is idle
+
+        Returns:
+            An idle pooled browser, or a newly created one
+        """
+        queue = self._queue(key)
+        if not queue.empty():
+            logger.debug("Reusing pooled browser")
+            return queue.get_nowait()
+
+        return await self._create(key, factory)
+
+    async def release(self, browser: Browser) -> None:
+        """
+        Return a browser to the pool, closing it if the pool is full.
+
+        Args:
+            browser: Browser obtained from acquire()
+        """
+        key = self._keys.get(id(browser))
+        if key is not None and self._queue(key).qsize() < self.size:
+            self._queue(key).put_nowait(browser)
+            logger.debug("Returned browser to pool")
+            return
+
+        self._keys.pop(id(browser), None)
+        await browser.close()
+
+    async def close(self) -> None:
+        """Close all idle browsers"""
+        for queue in self._idle.values():
+            while not queue.empty():
+                browser = queue.get_nowait()
+                self._keys.pop(id(browser), None)
+                try:
+                    await browser.close()
+                except Exception as e:
+                    logger.warning(f"Error closing pooled browser: {e}")
+        self._idle.clear()
+        logger.info("Closed browser pool")
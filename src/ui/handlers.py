@@ -1,26 +1,144 @@
 import os
+import time
 import logging
 import asyncio
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple, Optional
 
 import gradio as gr
 
 from src.browser.browser_manager import BrowserManager
+from src.browser.browser_pool import BrowserPool
 from src.agents.agent_manager import AgentManager
+from src.agents.llm_cache import InMemoryLRUCache
 from src.utils.env_utils import resolve_sensitive_env_variables
-from src.utils.file_utils import get_latest_files, ensure_directories, capture_screenshot
+from src.utils.file_utils import get_latest_files, ensure_directories
 from src.utils.llm_utils import get_llm_model, MissingAPIKeyError
 
 logger = logging.getLogger(__name__)
 
+# Maximum time between stream frames when the page emits no navigation events
+STREAM_HEARTBEAT_SECONDS = 1.0
+
+# Minimum time between stream updates pushed to the UI
+STREAM_LATENCY_SECONDS = 0.25
+
+# Route serving the latest streamed frame as raw image bytes
+STREAM_FRAME_ROUTE = "/stream/frame"
+
+# URL of the frame route relative to the page, so it stays under the app's
+# root path when served behind a reverse proxy
+STREAM_FRAME_URL = STREAM_FRAME_ROUTE.lstrip("/")
+
+@dataclass(frozen=True, slots=True)
+class AgentRunSpec:
+    """
+    Settings for a single agent run, as entered in the UI.
+    
+    The field order matches the inputs of the run button, so a spec can be
+    built directly from the positional values Gradio passes in.
+    """
+    agent_type: str
+    llm_provider: str
+    llm_model_name: str
+    llm_num_ctx: int
+    llm_temperature: float
+    llm_base_url: str
+    llm_api_key: str
+    use_own_browser: bool
+    keep_browser_open: bool
+    headless: bool
+    disable_security: bool
+    window_w: int
+    window_h: int
+    save_recording_path: str
+    save_agent_history_path: str
+    save_trace_path: str
+    enable_recording: bool
+    task: str
+    add_infos: str
+    max_steps: int
+    use_vision: bool
+    max_actions_per_step: int
+    tool_calling_method: str
+    chrome_cdp: str
+    max_input_tokens: int
+
+@lru_cache(maxsize=16)
+def _stream_viewport(window_w: int, window_h: int) -> Tuple[int, int]:
+    """
+    Get the stream display size for a browser window size.
+    
+    Args:
+        window_w: Browser window width
+        window_h: Browser window height
+        
+    Returns:
+        Tuple of (width in vw, height in vh) keeping the window aspect ratio
+    """
+    return 80, int(80 * window_h // window_w)
+
 class UIHandlers:
     """
     Handles UI events and coordinates actions between UI and backend components.
     """
     
-    def __init__(self):
-        self.browser_manager = BrowserManager()
-        self.agent_manager = AgentManager()
+    # Recurring button updates. Gradio pops "value" out of update dicts while
+    # postprocessing, so the ones carrying a value are copied before use.
+    _STOP_RESET = gr.update(value="Stop", interactive=True)
+    _STOP_PENDING = gr.update(value="Stopping...", interactive=False)
+    _RUN_RESET = gr.update(interactive=True)
+    _RUN_PENDING = gr.update(interactive=False)
+    _BTN_NOOP = gr.skip()
+    
+    def __init__(self, browser_pool_size: int = 0, llm_cache_size: int = 0):
+        self.browser_manager = BrowserManager(browser_pool=BrowserPool(size=browser_pool_size))
+        self.agent_manager = AgentManager(
+            response_cache=InMemoryLRUCache(maxsize=llm_cache_size) if llm_cache_size > 0 else None
+        )
+        
+    @staticmethod
+    def _browser_settings(
+            agent_type: str,
+            use_own_browser: bool,
+            headless: bool,
+            disable_security: bool,
+            window_w: int,
+            window_h: int,
+            chrome_cdp: str
+    ) -> Dict[str, Any]:
+        """
+        Translate UI browser settings into BrowserManager arguments.
+        
+        Returns:
+            Keyword arguments for BrowserManager.initialize_browser
+        """
+        return dict(
+            headless=headless,
+            disable_security=disable_security,
+            cdp_url=chrome_cdp if chrome_cdp else None,
+            extra_chromium_args=[f"--window-size={int(window_w)},{int(window_h)}"],
+            use_own_browser=use_own_browser,
+            browser_type="custom" if agent_type == "custom" else "default"
+        )
+        
+    async def prewarm_browser(
+            self,
+            agent_type: str,
+            use_own_browser: bool,
+            headless: bool,
+            disable_security: bool,
+            window_w: int,
+            window_h: int,
+            chrome_cdp: str
+    ) -> None:
+        """Pre-launch pooled browsers matching the given UI settings."""
+        await self.browser_manager.prewarm_browser(
+            **self._browser_settings(
+                agent_type, use_own_browser, headless, disable_security, window_w, window_h, chrome_cdp
+            )
+        )
         
     async def stop_agent(self) -> Tuple[gr.update, gr.update]:
         """
@@ -37,262 +155,196 @@ class UIHandlers:
             logger.info(f"🛑 {message}")
 
             return (
-                gr.update(value="Stopping...", interactive=False),  # stop_button
-                gr.update(interactive=False),  # run_button
+                dict(self._STOP_PENDING),  # stop_button
+                self._RUN_PENDING,  # run_button
             )
         except Exception as e:
             error_msg = f"Error during stop: {str(e)}"
             logger.error(error_msg)
             return (
-                gr.update(value="Stop", interactive=True),
-                gr.update(interactive=True)
+                dict(self._STOP_RESET),
+                self._RUN_RESET
             )
             
-    async def run_browser_agent(
+    def _run_outputs(
             self,
-            agent_type: str,
-            llm_provider: str,
-            llm_model_name: str,
-            llm_num_ctx: int,
-            llm_temperature: float,
-            llm_base_url: str,
-            llm_api_key: str,
-            use_own_browser: bool,
-            keep_browser_open: bool,
-            headless: bool,
-            disable_security: bool,
-            window_w: int,
-            window_h: int,
-            save_recording_path: str,
-            save_agent_history_path: str,
-            save_trace_path: str,
-            enable_recording: bool,
-            task: str,
-            add_infos: str,
-            max_steps: int,
-            use_vision: bool,
-            max_actions_per_step: int,
-            tool_calling_method: str,
-            chrome_cdp: str,
-            max_input_tokens: int
+            result: Dict[str, Any],
+            errors: str,
+            gif_path: Optional[str],
+            trace_file: Optional[str],
+            history_file: Optional[str]
     ) -> Tuple:
+        """
+        Build the run outputs for the UI from whatever a run produced.
+        
+        Args:
+            result: Agent results, empty if the agent didn't finish
+            errors: Error text to show
+            gif_path: Path to the animated history GIF, if any
+            trace_file: Path to the trace file, if any
+            history_file: Path to the agent history file, if any
+            
+        Returns:
+            Tuple of result values for UI update
+        """
+        return (
+            result.get("final_result", ""),
+            errors,
+            result.get("model_actions", ""),
+            result.get("model_thoughts", ""),
+            gif_path,
+            trace_file,
+            history_file,
+            dict(self._STOP_RESET),  # Re-enable stop button
+            self._RUN_RESET  # Re-enable run button
+        )
+        
+    async def run_browser_agent(self, spec: AgentRunSpec) -> Tuple:
         """
         Run a browser agent with the specified configuration.
         
+        Args:
+            spec: Settings of the run
+            
         Returns:
             Tuple of result values for UI update
+            
+        Raises:
+            gr.Error: If an API key is missing; its partial_outputs attribute
+                holds the result values produced before the failure
         """
+        # Kept across the steps so a failure late in the run still reports what succeeded
+        result = {}
+        gif_path = trace_file = history_file = None
         try:
             # Disable recording if not enabled
-            if not enable_recording:
-                save_recording_path = None
+            save_recording_path = spec.save_recording_path if spec.enable_recording else None
 
             # Ensure directories exist
             ensure_directories(
                 save_recording_path,
-                save_agent_history_path,
-                save_trace_path
+                spec.save_agent_history_path,
+                spec.save_trace_path
             )
 
             # Process sensitive environment variables in task
-            task = resolve_sensitive_env_variables(task)
+            task = resolve_sensitive_env_variables(spec.task)
 
             # Get LLM model
             llm = get_llm_model(
-                provider=llm_provider,
-                model_name=llm_model_name,
-                num_ctx=llm_num_ctx,
-                temperature=llm_temperature,
-                base_url=llm_base_url,
-                api_key=llm_api_key,
+                provider=spec.llm_provider,
+                model_name=spec.llm_model_name,
+                num_ctx=spec.llm_num_ctx,
+                temperature=spec.llm_temperature,
+                base_url=spec.llm_base_url,
+                api_key=spec.llm_api_key,
             )
 
             # Set up browser
-            extra_chromium_args = [f"--window-size={window_w},{window_h}"]
-            cdp_url = chrome_cdp if chrome_cdp else None
-
-            # Initialize browser with appropriate type
-            browser_type = "custom" if agent_type == "custom" else "default"
             await self.browser_manager.initialize_browser(
-                headless=headless,
-                disable_security=disable_security,
-                cdp_url=cdp_url,
-                extra_chromium_args=extra_chromium_args,
-                use_own_browser=use_own_browser,
-                browser_type=browser_type
+                **self._browser_settings(
+                    spec.agent_type, spec.use_own_browser, spec.headless, spec.disable_security,
+                    spec.window_w, spec.window_h, spec.chrome_cdp
+                )
             )
 
             # Initialize browser context
             await self.browser_manager.initialize_context(
-                window_width=window_w,
-                window_height=window_h,
-                save_trace_path=save_trace_path,
+                window_width=spec.window_w,
+                window_height=spec.window_h,
+                save_trace_path=spec.save_trace_path,
                 save_recording_path=save_recording_path
             )
 
             # Create and run agent
             await self.agent_manager.create_agent(
-                agent_type=agent_type,
+                agent_type=spec.agent_type,
                 task=task,
                 llm=llm,
                 browser_manager=self.browser_manager,
-                use_vision=use_vision,
-                max_actions_per_step=max_actions_per_step,
-                tool_calling_method=tool_calling_method,
-                max_input_tokens=max_input_tokens,
-                add_infos=add_infos
+                use_vision=spec.use_vision,
+                max_actions_per_step=spec.max_actions_per_step,
+                tool_calling_method=spec.tool_calling_method,
+                max_input_tokens=spec.max_input_tokens,
+                add_infos=spec.add_infos
             )
             
             # Run the agent
-            result = await self.agent_manager.run_agent(max_steps=max_steps)
+            result = await self.agent_manager.run_agent(max_steps=spec.max_steps)
             
             # Save agent history
-            history_file = self.agent_manager.save_history(save_agent_history_path)
+            history_file = await self.agent_manager.save_history(spec.save_agent_history_path)
             
             # Get the latest trace file
-            trace_file = get_latest_files(save_trace_path).get('.zip')
+            trace_file = get_latest_files(spec.save_trace_path).get('.zip')
             
             # Get the animated GIF path
             gif_path = os.path.join(os.path.dirname(__file__), "..", "..", "agent_history.gif")
             
             # Clean up resources if needed
-            if not keep_browser_open:
+            if not spec.keep_browser_open:
                 await self.browser_manager.close_browser()
                 
             # Reset agent state
             self.agent_manager.reset_agent()
 
-            return (
-                result["final_result"],
-                result["errors"],
-                result["model_actions"],
-                result["model_thoughts"],
-                gif_path,
-                trace_file,
-                history_file,
-                gr.update(value="Stop", interactive=True),  # Re-enable stop button
-                gr.update(interactive=True)  # Re-enable run button
-            )
+            return self._run_outputs(result, result["errors"], gif_path, trace_file, history_file)
 
         except MissingAPIKeyError as e:
             logger.error(str(e))
-            raise gr.Error(str(e), print_exception=False)
+            error = gr.Error(str(e), print_exception=False)
+            # Carried on the error rather than the shared handlers, so concurrent
+            # sessions only ever see their own run's outputs
+            error.partial_outputs = self._run_outputs(result, str(e), gif_path, trace_file, history_file)
+            raise error
 
         except Exception as e:
             import traceback
             traceback.print_exc()
             errors = str(e) + "\n" + traceback.format_exc()
-            return (
-                '',  # final_result
-                errors,  # errors
-                '',  # model_actions
-                '',  # model_thoughts
-                None,  # gif_path
-                None,  # trace_file
-                None,  # history_file
-                gr.update(value="Stop", interactive=True),  # Re-enable stop button
-                gr.update(interactive=True)  # Re-enable run button
-            )
+            return self._run_outputs(result, errors, gif_path, trace_file, history_file)
     
-    async def run_with_stream(
-            self,
-            agent_type: str,
-            llm_provider: str,
-            llm_model_name: str,
-            llm_num_ctx: int,
-            llm_temperature: float,
-            llm_base_url: str,
-            llm_api_key: str,
-            use_own_browser: bool,
-            keep_browser_open: bool,
-            headless: bool,
-            disable_security: bool,
-            window_w: int,
-            window_h: int,
-            save_recording_path: str,
-            save_agent_history_path: str,
-            save_trace_path: str,
-            enable_recording: bool,
-            task: str,
-            add_infos: str,
-            max_steps: int,
-            use_vision: bool,
-            max_actions_per_step: int,
-            tool_calling_method: str,
-            chrome_cdp: str,
-            max_input_tokens: int
-    ):
+    async def run_from_inputs(self, *inputs):
+        """
+        Gradio entry point for the run button.
+        
+        Args:
+            *inputs: Values of the run button inputs, in AgentRunSpec field order
+            
+        Yields:
+            UI updates at each step
+        """
+        async for update in self.run_with_stream(AgentRunSpec(*inputs)):
+            yield update
+            
+    async def run_with_stream(self, spec: AgentRunSpec):
         """
         Run an agent with live streaming of browser view.
         
+        Args:
+            spec: Settings of the run
+            
         Yields:
             UI updates at each step
         """
-        stream_vw = 80
-        stream_vh = int(80 * window_h // window_w)
+        stream_vw, stream_vh = _stream_viewport(spec.window_w, spec.window_h)
+        # Fixed HTML fragments, built once so each frame is a plain concat
+        img_pre = f'<img src="{STREAM_FRAME_URL}?v='
+        img_post = f'" style="width:{stream_vw}vw; height:{stream_vh}vh ; border:1px solid #ccc;">'
+        wait_html = f"<h1 style='width:{stream_vw}vw; height:{stream_vh}vh'>Waiting for browser session...</h1>"
         
-        if not headless:
+        if not spec.headless:
             # For non-headless mode, just run normally without streaming
-            result = await self.run_browser_agent(
-                agent_type=agent_type,
-                llm_provider=llm_provider,
-                llm_model_name=llm_model_name,
-                llm_num_ctx=llm_num_ctx,
-                llm_temperature=llm_temperature,
-                llm_base_url=llm_base_url,
-                llm_api_key=llm_api_key,
-                use_own_browser=use_own_browser,
-                keep_browser_open=keep_browser_open,
-                headless=headless,
-                disable_security=disable_security,
-                window_w=window_w,
-                window_h=window_h,
-                save_recording_path=save_recording_path,
-                save_agent_history_path=save_agent_history_path,
-                save_trace_path=save_trace_path,
-                enable_recording=enable_recording,
-                task=task,
-                add_infos=add_infos,
-                max_steps=max_steps,
-                use_vision=use_vision,
-                max_actions_per_step=max_actions_per_step,
-                tool_calling_method=tool_calling_method,
-                chrome_cdp=chrome_cdp,
-                max_input_tokens=max_input_tokens
-            )
+            result = await self.run_browser_agent(spec)
             # Add HTML content at the start of the result array
             yield [gr.update(visible=False)] + list(result)
         else:
+            # Don't show the previous run's last frame
+            self.browser_manager.clear_frame()
             try:
                 # Run the browser agent in the background
                 agent_task = asyncio.create_task(
-                    self.run_browser_agent(
-                        agent_type=agent_type,
-                        llm_provider=llm_provider,
-                        llm_model_name=llm_model_name,
-                        llm_num_ctx=llm_num_ctx,
-                        llm_temperature=llm_temperature,
-                        llm_base_url=llm_base_url,
-                        llm_api_key=llm_api_key,
-                        use_own_browser=use_own_browser,
-                        keep_browser_open=keep_browser_open,
-                        headless=headless,
-                        disable_security=disable_security,
-                        window_w=window_w,
-                        window_h=window_h,
-                        save_recording_path=save_recording_path,
-                        save_agent_history_path=save_agent_history_path,
-                        save_trace_path=save_trace_path,
-                        enable_recording=enable_recording,
-                        task=task,
-                        add_infos=add_infos,
-                        max_steps=max_steps,
-                        use_vision=use_vision,
-                        max_actions_per_step=max_actions_per_step,
-                        tool_calling_method=tool_calling_method,
-                        chrome_cdp=chrome_cdp,
-                        max_input_tokens=max_input_tokens
-                    )
+                    self.run_browser_agent(spec)
                 )
 
                 # Initialize values for streaming
@@ -300,21 +352,52 @@ class UIHandlers:
                 final_result = errors = model_actions = model_thoughts = ""
                 recording_gif = trace = history_file = None
 
-                # Periodically update the stream while the agent task is running
+                # Redraw on page navigation/load events, with a slow heartbeat as a fallback
+                redraw = asyncio.Event()
+                watched_page = None
+
+                def request_redraw(_):
+                    redraw.set()
+
+                last_emit = last_html = None
+                last_version = decode_task = None
+
+                # Update the stream while the agent task is running
                 while not agent_task.done():
                     try:
-                        encoded_screenshot = await capture_screenshot(self.browser_manager.browser_context)
-                        if encoded_screenshot is not None:
-                            html_content = f'<img src="data:image/jpeg;base64,{encoded_screenshot}" style="width:{stream_vw}vw; height:{stream_vh}vh ; border:1px solid #ccc;">'
+                        page = await self.browser_manager.get_primary_page()
+                        if page is not None and page is not watched_page:
+                            if watched_page is not None:
+                                watched_page.remove_listener("framenavigated", request_redraw)
+                                watched_page.remove_listener("load", request_redraw)
+                            page.on("framenavigated", request_redraw)
+                            page.on("load", request_redraw)
+                            watched_page = page
+
+                        # Abandon the capture if the agent finishes first; its frame would
+                        # be thrown away and only delay the final update
+                        capture_task = asyncio.create_task(self.browser_manager.capture_screenshot())
+                        await asyncio.wait([capture_task, agent_task], return_when=asyncio.FIRST_COMPLETED)
+                        if not capture_task.done():
+                            capture_task.cancel()
+                            break
+                        screenshot = capture_task.result()
+                        if screenshot is not None:
+                            if self.browser_manager.frame_version != last_version:
+                                # Decode the new frame while the update travels to the UI
+                                decode_task = asyncio.create_task(self.browser_manager.prepare_frame())
+                                last_version = self.browser_manager.frame_version
+                            # The frame version only changes with the frame content, so identical
+                            # frames produce identical HTML and are not sent again
+                            html_content = img_pre + str(self.browser_manager.frame_version) + img_post
                         else:
-                            html_content = f"<h1 style='width:{stream_vw}vw; height:{stream_vh}vh'>Waiting for browser session...</h1>"
+                            html_content = wait_html
                     except Exception as e:
-                        html_content = f"<h1 style='width:{stream_vw}vw; height:{stream_vh}vh'>Waiting for browser session...</h1>"
+                        html_content = wait_html
 
-                    agent_state = self.agent_manager.get_agent_state()
-                    if agent_state.stopped:
+                    if self.agent_manager.get_agent_state().is_stop_requested():
                         yield [
-                            gr.HTML(value=html_content, visible=True),
+                            gr.update(value=html_content, visible=True),
                             final_result,
                             errors,
                             model_actions,
@@ -322,13 +405,17 @@ class UIHandlers:
                             recording_gif,
                             trace,
                             history_file,
-                            gr.update(value="Stopping...", interactive=False),  # stop_button
-                            gr.update(interactive=False),  # run_button
+                            dict(self._STOP_PENDING),  # stop_button
+                            self._RUN_PENDING,  # run_button
                         ]
                         break
-                    else:
+
+                    # Coalesce frames within the latency window and only send fields that changed
+                    now = time.monotonic()
+                    if last_emit is None:
+                        # The first update also clears the results of the previous run
                         yield [
-                            gr.HTML(value=html_content, visible=True),
+                            gr.update(value=html_content, visible=True),
                             final_result,
                             errors,
                             model_actions,
@@ -336,25 +423,44 @@ class UIHandlers:
                             recording_gif,
                             trace,
                             history_file,
-                            gr.update(),  # Stop button
-                            gr.update()  # Run button
+                            self._BTN_NOOP,  # Stop button
+                            self._BTN_NOOP  # Run button
                         ]
-                    await asyncio.sleep(0.1)
+                        last_emit, last_html = now, html_content
+                    elif html_content != last_html and now - last_emit >= STREAM_LATENCY_SECONDS:
+                        # Results only change once the agent finishes
+                        yield [gr.update(value=html_content, visible=True)] + [gr.skip()] * 9
+                        last_emit, last_html = now, html_content
+
+                    redraw_task = asyncio.create_task(redraw.wait())
+                    await asyncio.wait(
+                        [redraw_task, agent_task],
+                        timeout=STREAM_HEARTBEAT_SECONDS,
+                        return_when=asyncio.FIRST_COMPLETED
+                    )
+                    redraw_task.cancel()
+                    redraw.clear()
+
+                if watched_page is not None:
+                    watched_page.remove_listener("framenavigated", request_redraw)
+                    watched_page.remove_listener("load", request_redraw)
+                if decode_task is not None:
+                    decode_task.cancel()
 
                 # Once the agent task completes, get the results
                 try:
                     result = await agent_task
                     final_result, errors, model_actions, model_thoughts, recording_gif, trace, history_file, stop_button, run_button = result
-                except gr.Error:
-                    final_result = ""
-                    model_actions = ""
-                    model_thoughts = ""
-                    recording_gif = trace = history_file = None
+                except gr.Error as e:
+                    # Show whatever the run produced before failing
+                    partial = getattr(e, "partial_outputs", None)
+                    if partial is not None:
+                        final_result, errors, model_actions, model_thoughts, recording_gif, trace, history_file, _, _ = partial
                 except Exception as e:
                     errors = f"Agent error: {str(e)}"
 
                 yield [
-                    gr.HTML(value=html_content, visible=True),
+                    gr.update(value=html_content, visible=True),
                     final_result,
                     errors,
                     model_actions,
@@ -362,15 +468,15 @@ class UIHandlers:
                     recording_gif,
                     trace,
                     history_file,
-                    gr.update(value="Stop", interactive=True),  # stop_button
-                    gr.update(interactive=True)  # run_button
+                    dict(self._STOP_RESET),  # stop_button
+                    self._RUN_RESET  # run_button
                 ]
 
             except Exception as e:
                 import traceback
                 yield [
-                    gr.HTML(
-                        value=f"<h1 style='width:{stream_vw}vw; height:{stream_vh}vh'>Waiting for browser session...</h1>",
+                    gr.update(
+                        value=wait_html,
                         visible=True),
                     "",
                     f"Error: {str(e)}\n{traceback.format_exc()}",
@@ -379,8 +485,8 @@ class UIHandlers:
                     None,
                     None,
                     None,
-                    gr.update(value="Stop", interactive=True),  # Re-enable stop button
-                    gr.update(interactive=True)  # Re-enable run button
+                    dict(self._STOP_RESET),  # Re-enable stop button
+                    self._RUN_RESET  # Re-enable run button
                 ]
                 
     async def close_browser(self) -> None:
@@ -0,0 +1,70 @@
+import time
+import asyncio
+from functools import wraps
+from typing import Any, List, Callable, AsyncIterator
+
+import gradio as gr
+
+# Minimum time between any two updates of a throttled handler (at most 20 Hz)
+UPDATE_MIN_INTERVAL_SECONDS = 0.05
+
+def _merge_updates(pending: List[Any], update: List[Any]) -> List[Any]:
+    """Combine two output updates, keeping earlier values where the later one skips"""
+    skip = gr.skip()
+    return [old if new == skip else new for old, new in zip(pending, update)]
+
+def throttle_updates(
+        handler: Callable[..., AsyncIterator[List[Any]]],
+        interval: float = UPDATE_MIN_INTERVAL_SECONDS
+) -> Callable[..., AsyncIterator[List[Any]]]:
+    """
+    Limit how often a streaming handler pushes updates to the UI.
+    
+    Gradio re-renders every output on each yield, so updates arriving within
+    `interval` of the previous one are merged and sent together once the
+    interval has passed. The last update is always sent.
+    
+    Args:
+        handler: Async generator function yielding lists of output updates
+        interval: Minimum time between two updates in seconds
+        
+    Returns:
+        Async generator function with the same arguments as `handler`
+    """
+    @wraps(handler)
+    async def throttled(*args, **kwargs):
+        updates = handler(*args, **kwargs).__aiter__()
+        pending = next_update = None
+        last_emit = float("-inf")
+        try:
+            while True:
+                if next_update is None:
+                    next_update = asyncio.ensure_future(updates.__anext__())
+                    
+                # Wait for the next update, or until a held one is due
+                timeout = None if pending is None else max(0.0, last_emit + interval - time.monotonic())
+                done, _ = await asyncio.wait([next_update], timeout=timeout)
+                if done:
+                    try:
+                        update = next_update.result()
+                    except StopAsyncIteration:
+                        break
+                    finally:
+                        next_update = None
+                    pending = update if pending is None else _merge_updates(pending, update)
+                    if time.monotonic() - last_emit < interval:
+                        continue
+                        
+                yield pending
+                pending, last_emit = None, time.monotonic()
+                
+            if pending is not None:
+                yield pending
+        finally:
+            # Stop the wrapped handler if the UI stopped consuming updates
+            if next_update is not None:
+                next_update.cancel()
+            else:
+                await updates.aclose()
+            
+    return throttled
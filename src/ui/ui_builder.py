@@ -1,37 +1,89 @@
 import os
+import asyncio
 import logging
+from functools import lru_cache
 import gradio as gr
-from typing import Dict, Any, Optional
+import uvicorn
+from fastapi import FastAPI, Response
+from typing import Dict, Any, Optional, Tuple
 
 from src.ui.component_manager import ComponentManager, scan_and_register_components
-from src.ui.handlers import UIHandlers
-from src.utils.llm_utils import MODEL_NAMES, update_model_dropdown
+from src.ui.handlers import UIHandlers, STREAM_FRAME_ROUTE
+from src.ui.throttle import throttle_updates
+from src.utils.llm_utils import MODEL_NAMES, PROVIDERS, update_model_dropdown, close_http_clients
 from src.utils.file_utils import list_recordings
 
 logger = logging.getLogger(__name__)
 
-# Define theme mapping
-THEME_MAP = {
-    "Default": gr.themes.Default(),
-    "Soft": gr.themes.Soft(),
-    "Monochrome": gr.themes.Monochrome(),
-    "Glass": gr.themes.Glass(),
-    "Origin": gr.themes.Origin(),
-    "Citrus": gr.themes.Citrus(),
-    "Ocean": gr.themes.Ocean(),
-    "Base": gr.themes.Base()
+# Define theme mapping; themes are only instantiated when used
+_THEME_FACTORIES = {
+    "Default": gr.themes.Default,
+    "Soft": gr.themes.Soft,
+    "Monochrome": gr.themes.Monochrome,
+    "Glass": gr.themes.Glass,
+    "Origin": gr.themes.Origin,
+    "Citrus": gr.themes.Citrus,
+    "Ocean": gr.themes.Ocean,
+    "Base": gr.themes.Base
 }
+THEME_NAMES = tuple(_THEME_FACTORIES)
+
+@lru_cache(maxsize=None)
+def _get_theme(name: str) -> gr.themes.Base:
+    """Get the theme with a given name"""
+    return _THEME_FACTORIES[name]()
+
+# Custom CSS for the UI
+_CSS = """
+.gradio-container {
+    width: 60vw !important; 
+    max-width: 60% !important; 
+    margin-left: auto !important;
+    margin-right: auto !important;
+    padding-top: 20px !important;
+}
+.header-text {
+    text-align: center;
+    margin-bottom: 30px;
+}
+.theme-section {
+    margin-bottom: 20px;
+    padding: 15px;
+    border-radius: 10px;
+}
+"""
+
+_HEADER_MD = """
+# 🌐 Browser Use WebUI
+### Control your browser with AI assistance
+"""
+
+# Recurring visibility/interactivity updates, shared since they carry no value
+_CTX_VISIBLE = gr.update(visible=True)
+_CTX_HIDDEN = gr.update(visible=False)
+_INPUT_ENABLED = gr.update(interactive=True)
+_INPUT_DISABLED = gr.update(interactive=False)
+
+# Shown in the live browser view until the first frame arrives
+_BROWSER_PLACEHOLDER_HTML = "<h1 style='width:80vw; height:50vh'>Waiting for browser session...</h1>"
 
 class UIBuilder:
     """
     Builds and configures the Gradio UI.
     """
     
-    def __init__(self, theme_name: str = "Ocean"):
+    def __init__(self, theme_name: str = "Ocean", browser_pool_size: int = 0, llm_cache_size: int = 0):
         self.theme_name = theme_name
         self.component_manager = ComponentManager()
-        self.ui_handlers = UIHandlers()
+        self.ui_handlers = UIHandlers(browser_pool_size=browser_pool_size, llm_cache_size=llm_cache_size)
         self.demo = None
+        # Components passed to and updated by an agent run, set by build_ui
+        self._run_inputs: Tuple[gr.components.Component, ...] = ()
+        self._run_outputs: Tuple[gr.components.Component, ...] = ()
+        # Default browser settings, set by build_ui, and the startup task
+        # pre-launching pooled browsers for them
+        self._default_browser_settings: Optional[Dict[str, Any]] = None
+        self._prewarm_task: Optional[asyncio.Task] = None
         
     def build_ui(self) -> gr.Blocks:
         """
@@ -40,38 +92,13 @@ class UIBuilder:
         Returns:
             Configured Gradio Blocks interface
         """
-        css = """
-        .gradio-container {
-            width: 60vw !important; 
-            max-width: 60% !important; 
-            margin-left: auto !important;
-            margin-right: auto !important;
-            padding-top: 20px !important;
-        }
-        .header-text {
-            text-align: center;
-            margin-bottom: 30px;
-        }
-        .theme-section {
-            margin-bottom: 20px;
-            padding: 15px;
-            border-radius: 10px;
-        }
-        """
-
         with gr.Blocks(
                 title="Browser Use WebUI", 
-                theme=THEME_MAP[self.theme_name], 
-                css=css
+                theme=_get_theme(self.theme_name), 
+                css=_CSS
         ) as self.demo:
             with gr.Row():
-                gr.Markdown(
-                    """
-                    # 🌐 Browser Use WebUI
-                    ### Control your browser with AI assistance
-                    """,
-                    elem_classes=["header-text"],
-                )
+                gr.Markdown(_HEADER_MD, elem_classes=["header-text"])
 
             with gr.Tabs() as tabs:
                 # Tab 1: Agent Settings
@@ -130,7 +157,7 @@ class UIBuilder:
                 with gr.TabItem("🔧 LLM Settings", id=2):
                     with gr.Group():
                         llm_provider = gr.Dropdown(
-                            choices=[provider for provider in MODEL_NAMES.keys()],
+                            choices=list(PROVIDERS),
                             label="LLM Provider",
                             value="openai",
                             info="Select your preferred language model provider",
@@ -282,7 +309,7 @@ class UIBuilder:
 
                     with gr.Row():
                         browser_view = gr.HTML(
-                            value="<h1 style='width:80vw; height:50vh'>Waiting for browser session...</h1>",
+                            value=_BROWSER_PLACEHOLDER_HTML,
                             label="Live Browser View",
                             visible=False
                         )
@@ -311,15 +338,33 @@ class UIBuilder:
                     agent_history_file = gr.File(label="Agent History")
 
                 # Tab 5: Recordings
-                with gr.TabItem("🎥 Recordings", id=7, visible=True):
+                with gr.TabItem("🎥 Recordings", id=7, visible=True) as recordings_tab:
                     recordings_gallery = gr.Gallery(
                         label="Recordings",
                         columns=3,
                         height="auto",
                         object_fit="contain"
                     )
+                    # Whether this session's gallery has been filled yet
+                    recordings_loaded = gr.State(False)
 
-                    refresh_button = gr.Button("🔄 Refresh Recordings", variant="secondary")
+                    with gr.Row():
+                        refresh_button = gr.Button("🔄 Refresh Recordings", variant="secondary")
+                        recordings_page = gr.Number(
+                            label="Page",
+                            value=0,
+                            minimum=0,
+                            precision=0,
+                            interactive=True
+                        )
+                        recordings_page_size = gr.Slider(
+                            minimum=12,
+                            maximum=96,
+                            value=24,
+                            step=12,
+                            label="Recordings per Page",
+                            interactive=True
+                        )
 
                 # Tab 6: UI Configuration
                 with gr.TabItem("📁 UI Configuration", id=8):
@@ -339,30 +384,21 @@ class UIBuilder:
                     )
 
             # Event handlers
-            def update_ctx_visibility(provider):
-                return gr.update(visible=provider == "ollama")
-
-            # Bind the change event of llm_provider
-            llm_provider.change(
-                fn=update_ctx_visibility,
-                inputs=llm_provider,
-                outputs=ollama_num_ctx
-            )
+            async def on_provider_change(provider, api_key, base_url):
+                # Context length only applies to Ollama
+                ctx_update = _CTX_VISIBLE if provider == "ollama" else _CTX_HIDDEN
+                return ctx_update, await update_model_dropdown(provider, api_key, base_url)
 
-            # Update models when provider changes
+            # Update context visibility and models in one round trip when provider changes
             llm_provider.change(
-                fn=lambda provider, api_key, base_url: update_model_dropdown(
-                    provider=provider, 
-                    api_key=api_key, 
-                    base_url=base_url
-                ),
+                fn=on_provider_change,
                 inputs=[llm_provider, llm_api_key, llm_base_url],
-                outputs=llm_model_name
+                outputs=[ollama_num_ctx, llm_model_name]
             )
 
             # Enable/disable recording path based on recording checkbox
             enable_recording.change(
-                fn=lambda enabled: gr.update(interactive=enabled),
+                fn=lambda enabled: _INPUT_ENABLED if enabled else _INPUT_DISABLED,
                 inputs=enable_recording,
                 outputs=save_recording_path
             )
@@ -372,18 +408,21 @@ class UIBuilder:
             keep_browser_open.change(fn=self.ui_handlers.close_browser)
 
             # Run and stop buttons
+            # Inputs are in AgentRunSpec field order
+            self._run_inputs = (
+                agent_type, llm_provider, llm_model_name, ollama_num_ctx, llm_temperature, llm_base_url,
+                llm_api_key, use_own_browser, keep_browser_open, headless, disable_security, window_w, window_h,
+                save_recording_path, save_agent_history_path, save_trace_path, enable_recording, task, add_infos, 
+                max_steps, use_vision, max_actions_per_step, tool_calling_method, chrome_cdp, max_input_tokens
+            )
+            self._run_outputs = (
+                browser_view, final_result_output, errors_output, model_actions_output, model_thoughts_output,
+                recording_gif, trace_file, agent_history_file, stop_button, run_button
+            )
             run_button.click(
-                fn=self.ui_handlers.run_with_stream,
-                inputs=[
-                    agent_type, llm_provider, llm_model_name, ollama_num_ctx, llm_temperature, llm_base_url,
-                    llm_api_key, use_own_browser, keep_browser_open, headless, disable_security, window_w, window_h,
-                    save_recording_path, save_agent_history_path, save_trace_path, enable_recording, task, add_infos, 
-                    max_steps, use_vision, max_actions_per_step, tool_calling_method, chrome_cdp, max_input_tokens
-                ],
-                outputs=[
-                    browser_view, final_result_output, errors_output, model_actions_output, model_thoughts_output,
-                    recording_gif, trace_file, agent_history_file, stop_button, run_button
-                ],
+                fn=throttle_updates(self.ui_handlers.run_from_inputs),
+                inputs=self._run_inputs,
+                outputs=self._run_outputs,
             )
 
             stop_button.click(
@@ -392,12 +431,19 @@ class UIBuilder:
                 outputs=[stop_button, run_button],
             )
 
-            # Recordings gallery
-            refresh_button.click(
-                fn=list_recordings,
-                inputs=save_recording_path,
-                outputs=recordings_gallery
+            # Recordings gallery, filled when the tab is first opened
+            recordings_inputs = [save_recording_path, recordings_page, recordings_page_size]
+            recordings_tab.select(
+                fn=self._load_recordings_once,
+                inputs=[recordings_loaded, *recordings_inputs],
+                outputs=[recordings_gallery, recordings_loaded]
             )
+            for trigger in (refresh_button.click, recordings_page.change, recordings_page_size.change):
+                trigger(
+                    fn=list_recordings,
+                    inputs=recordings_inputs,
+                    outputs=recordings_gallery
+                )
 
             # Config management
             save_config_button.click(
@@ -415,12 +461,58 @@ class UIBuilder:
             # Register components for configuration management
             scan_and_register_components(self.demo, self.component_manager)
 
+            # Browser settings used to pre-launch pooled browsers
+            self._default_browser_settings = dict(
+                agent_type=agent_type.value,
+                use_own_browser=use_own_browser.value,
+                headless=headless.value,
+                disable_security=disable_security.value,
+                window_w=window_w.value,
+                window_h=window_h.value,
+                chrome_cdp=chrome_cdp.value
+            )
+
         return self.demo
         
+    @staticmethod
+    def _load_recordings_once(loaded: bool, save_recording_path: str, page: int, page_size: int):
+        """
+        List recordings for the gallery the first time the Recordings tab is opened.
+        
+        The loaded flag is kept per session, so each browser session fills its
+        own gallery. Later visits keep the gallery as is; the refresh button
+        reloads it.
+        """
+        if loaded:
+            return gr.skip(), gr.skip()
+        return list_recordings(save_recording_path, page, page_size), True
+        
+    def _stream_frame(self) -> Response:
+        """Serve the latest streamed browser frame as raw image bytes"""
+        browser_manager = self.ui_handlers.browser_manager
+        frame = browser_manager.last_frame
+        if frame is None:
+            return Response(status_code=204)
+        return Response(
+            content=frame,
+            media_type=browser_manager.frame_media_type,
+            headers={"Cache-Control": "no-store"}
+        )
+        
+    async def _prewarm_browsers(self) -> None:
+        """Pre-launch pooled browsers for the default settings in the background"""
+        if self._default_browser_settings and self.ui_handlers.browser_manager.browser_pool.size > 0:
+            self._prewarm_task = asyncio.create_task(
+                self.ui_handlers.prewarm_browser(**self._default_browser_settings)
+            )
+        
     def launch(self, server_name: str = "127.0.0.1", server_port: int = 7788) -> None:
         """
         Launch the UI server.
         
+        The Gradio app is mounted on a FastAPI app that also serves the live
+        browser frames, so the stream doesn't have to inline them as base64.
+        
         Args:
             server_name: Server hostname
             server_port: Server port
@@ -428,4 +520,10 @@ class UIBuilder:
         if self.demo is None:
             self.build_ui()
             
-        self.demo.launch(server_name=server_name, server_port=server_port) 
\ No newline at end of file
+        app = FastAPI()
+        app.add_api_route(STREAM_FRAME_ROUTE, self._stream_frame, methods=["GET"])
+        app.add_event_handler("startup", self._prewarm_browsers)
+        app.add_event_handler("shutdown", self.ui_handlers.browser_manager.browser_pool.close)
+        app.add_event_handler("shutdown", close_http_clients)
+        app = gr.mount_gradio_app(app, self.demo, path="/")
+        uvicorn.run(app, host=server_name, port=server_port) 
\ No newline at end of file
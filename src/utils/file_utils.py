@@ -1,11 +1,17 @@
 import os
-import glob
 import logging
-import base64
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Extensions of browser recordings, lowercase
+VIDEO_EXTENSIONS = (".mp4", ".webm")
+
+# Directories already created by ensure_directories in this process; each
+# is still checked with a stat so one removed since is created again
+_ENSURED: Set[str] = set()
+
 def get_latest_files(directory: Optional[str]) -> Dict[str, str]:
     """
     Get the latest files in a directory by file extension.
@@ -19,55 +25,71 @@ def get_latest_files(directory: Optional[str]) -> Dict[str, str]:
     if not directory or not os.path.exists(directory):
         return {}
         
-    result = {}
+    latest = {}
     
     try:
-        # List all files and their modification times
-        files = []
-        for filename in os.listdir(directory):
-            filepath = os.path.join(directory, filename)
-            if os.path.isfile(filepath):
-                ext = os.path.splitext(filename)[1]
-                files.append((filepath, os.path.getmtime(filepath), ext))
-                
-        # Group by extension and get the latest for each
-        for filepath, mtime, ext in sorted(files, key=lambda x: x[1], reverse=True):
-            if ext not in result:
-                result[ext] = filepath
+        # Keep the newest file per extension in a single pass
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                ext = os.path.splitext(entry.name)[1]
+                mtime = entry.stat().st_mtime
+                current = latest.get(ext)
+                if current is None or mtime > current[0]:
+                    latest[ext] = (mtime, entry.path)
     except Exception as e:
         logger.error(f"Error listing files in {directory}: {e}")
         
-    return result
+    return {ext: path for ext, (_, path) in latest.items()}
+
+@lru_cache(maxsize=4)
+def _scan_recordings(save_recording_path: str, dir_mtime_ns: int) -> Tuple[Tuple[float, str, str], ...]:
+    """
+    Scan a directory for recordings, sorted by creation time (oldest first).
+    
+    Cached per directory modification time, which changes whenever a file is
+    added, removed or renamed, so paging through recordings doesn't re-scan.
+    
+    Returns:
+        Tuple of (ctime, file_path, file_name) for all video files
+    """
+    # Get all video files with their creation times in a single directory pass
+    with os.scandir(save_recording_path) as entries:
+        recordings = [
+            (entry.stat().st_ctime, entry.path, entry.name)
+            for entry in entries
+            if entry.is_file(follow_symlinks=False)
+            and entry.name.lower().endswith(VIDEO_EXTENSIONS)
+        ]
+    recordings.sort()
+    return tuple(recordings)
 
-def list_recordings(save_recording_path: str) -> List[tuple]:
+def list_recordings(save_recording_path: str, page: int = 0, page_size: int = 24) -> List[tuple]:
     """
-    List all recordings in the given directory.
+    List a page of recordings in the given directory.
     
     Args:
         save_recording_path: Path to the recordings directory
+        page: Zero-based page number
+        page_size: Number of recordings per page
         
     Returns:
-        List of tuples (file_path, display_name) for all video files
+        List of tuples (file_path, display_name) for the video files on the page
     """
-    if not os.path.exists(save_recording_path):
+    try:
+        dir_mtime_ns = os.stat(save_recording_path).st_mtime_ns
+    except (OSError, TypeError):
         return []
-
-    # Get all video files
-    recordings = (
-        glob.glob(os.path.join(save_recording_path, "*.[mM][pP]4")) + 
-        glob.glob(os.path.join(save_recording_path, "*.[wW][eE][bB][mM]"))
-    )
-
-    # Sort recordings by creation time (oldest first)
-    recordings.sort(key=os.path.getctime)
-
-    # Add numbering to the recordings
-    numbered_recordings = []
-    for idx, recording in enumerate(recordings, start=1):
-        filename = os.path.basename(recording)
-        numbered_recordings.append((recording, f"{idx}. {filename}"))
-
-    return numbered_recordings
+    recordings = _scan_recordings(save_recording_path, dir_mtime_ns)
+    
+    # Add numbering to the recordings, counting from the first page
+    page, page_size = max(int(page or 0), 0), max(int(page_size or 1), 1)
+    start = page * page_size
+    return [
+        (path, f"{idx}. {name}")
+        for idx, (_, path, name) in enumerate(recordings[start:start + page_size], start=start + 1)
+    ]
 
 def ensure_directories(*paths: str) -> None:
     """
@@ -77,30 +99,7 @@ def ensure_directories(*paths: str) -> None:
         *paths: Directory paths to create
     """
     for path in paths:
-        if path:
+        if path and not (path in _ENSURED and os.path.isdir(path)):
             os.makedirs(path, exist_ok=True)
-            logger.debug(f"Ensured directory exists: {path}")
-
-async def capture_screenshot(browser_context) -> Optional[str]:
-    """
-    Capture a screenshot from the browser context.
-    
-    Args:
-        browser_context: Browser context to capture from
-        
-    Returns:
-        Base64-encoded screenshot or None if unable to capture
-    """
-    if browser_context is None:
-        return None
-        
-    try:
-        pages = await browser_context.get_pages()
-        if not pages:
-            return None
-            
-        screenshot_bytes = await pages[0].screenshot(type="jpeg", quality=80)
-        return base64.b64encode(screenshot_bytes).decode('utf-8')
-    except Exception as e:
-        logger.error(f"Error capturing screenshot: {e}")
-        return None 
\ No newline at end of file
+            _ENSURED.add(path)
+            logger.debug(f"Ensured directory exists: {path}")
\ No newline at end of file
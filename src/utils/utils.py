@@ -5,7 +5,6 @@ from pathlib import Path
 from typing import Dict, Optional
 import requests
 import json
-import gradio as gr
 import uuid
 
 from langchain_anthropic import ChatAnthropic
@@ -309,6 +308,7 @@ class ConfigManager:
 
     def update_ui_from_config(self, config_file):
         """Update UI components from a loaded configuration file."""
+        import gradio as gr
         if config_file is None:
             return [gr.update() for _ in self.component_order] + ["No file selected."]
 
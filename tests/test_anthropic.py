@@ -3,44 +3,42 @@
 Test script to verify Anthropic API key functionality
 """
 import os
-from dotenv import load_dotenv
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+import pytest
+
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-env_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env')
-load_dotenv(dotenv_path=env_path)
+def test_anthropic_api_key():
+    # Only read the .env file when the key isn't already set
+    if "ANTHROPIC_API_KEY" not in os.environ:
+        from dotenv import load_dotenv
+        load_dotenv(dotenv_path=os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env'))
 
-# Get the API key
-api_key = os.getenv("ANTHROPIC_API_KEY")
-if api_key:
+    if not (api_key := os.environ.get("ANTHROPIC_API_KEY")):
+        pytest.skip("Anthropic API key not found in environment variables")
     logger.info(f"Testing Anthropic API key: {api_key[:10]}...{api_key[-4:]}")
-else:
-    logger.error("Anthropic API key not found in environment variables")
-    exit(1)
-
-try:
-    # Only import if API key exists
-    from langchain_anthropic import ChatAnthropic
-    
+
+    langchain_anthropic = pytest.importorskip(
+        "langchain_anthropic", reason="langchain-anthropic is not installed: pip install langchain-anthropic"
+    )
+
     # Initialize the model with a valid model name
     # Use one of: claude-3-opus-20240229, claude-3-sonnet-20240229, claude-3-haiku-20240307
-    model = ChatAnthropic(
+    model = langchain_anthropic.ChatAnthropic(
         model="claude-3-haiku-20240307",
         anthropic_api_key=api_key
     )
-    
+
     # Test the model with a simple prompt
-    response = model.invoke("Hello, how are you today?")
-    
-    # Print the response
+    try:
+        response = model.invoke("Hello, how are you today?")
+    except Exception as e:
+        pytest.fail(f"Error testing Anthropic API: {e}")
+
     logger.info("Anthropic API test successful!")
     logger.info(f"Response: {response.content}")
-    
-except ImportError:
-    logger.error("Error importing langchain_anthropic. Make sure it's installed: pip install langchain-anthropic")
-except Exception as e:
-    logger.error(f"Error testing Anthropic API: {e}") 
\ No newline at end of file
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    raise SystemExit(pytest.main([__file__, "-q"]))
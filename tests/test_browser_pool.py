@@ -0,0 +1,76 @@
+import sys
+import asyncio
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+browser_pool = pytest.importorskip("src.browser.browser_pool")
+
+class FakeBrowser:
+    """Stand-in for browser_use's Browser that records launches and closes"""
+
+    def __init__(self):
+        self.launched = False
+        self.closed = False
+
+    async def get_playwright_browser(self):
+        self.launched = True
+
+    async def close(self):
+        self.closed = True
+
+def test_size_zero_closes_on_release():
+    async def run():
+        pool = browser_pool.BrowserPool(size=0)
+        browser = await pool.acquire("key", FakeBrowser)
+        await pool.release(browser)
+        return pool, browser
+
+    pool, browser = asyncio.run(run())
+    assert browser.closed
+    assert pool._queue("key").empty()
+
+def test_released_browser_is_reused_for_same_key():
+    async def run():
+        pool = browser_pool.BrowserPool(size=1)
+        first = await pool.acquire("key", FakeBrowser)
+        await pool.release(first)
+        again = await pool.acquire("key", FakeBrowser)
+        other = await pool.acquire("other", FakeBrowser)
+        return first, again, other
+
+    first, again, other = asyncio.run(run())
+    assert again is first and not first.closed
+    assert other is not first
+
+def test_release_closes_when_pool_is_full():
+    async def run():
+        pool = browser_pool.BrowserPool(size=1)
+        first = await pool.acquire("key", FakeBrowser)
+        second = await pool.acquire("key", FakeBrowser)
+        await pool.release(first)
+        await pool.release(second)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert not first.closed
+    assert second.closed
+
+def test_prewarm_and_close():
+    created = []
+
+    def factory():
+        created.append(FakeBrowser())
+        return created[-1]
+
+    async def run():
+        pool = browser_pool.BrowserPool(size=2)
+        await pool.prewarm("key", factory)
+        launched = [browser.launched for browser in created]
+        await pool.close()
+        return launched
+
+    assert asyncio.run(run()) == [True, True]
+    assert all(browser.closed for browser in created)
@@ -0,0 +1,51 @@
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.utils.file_utils import ensure_directories, list_recordings
+
+def _make_recordings(directory: Path, count: int) -> None:
+    # Creation times may tie on coarse filesystem clocks, so tests don't
+    # rely on which file lands on which page
+    for i in range(count):
+        (directory / f"rec_{i:03d}.mp4").write_bytes(b"")
+    (directory / "notes.txt").write_bytes(b"")
+
+def test_page_is_listed_at_once(tmp_path):
+    _make_recordings(tmp_path, 30)
+    recordings = list_recordings(str(tmp_path), page=0, page_size=24)
+    assert len(recordings) == 24
+    assert recordings == list_recordings(str(tmp_path), page=0, page_size=30)[:24]
+
+def test_numbering_is_global_across_pages(tmp_path):
+    _make_recordings(tmp_path, 30)
+    pages = [list_recordings(str(tmp_path), page=page, page_size=24) for page in range(3)]
+    assert [len(page) for page in pages] == [24, 6, 0]
+    labels = [label for page in pages for _, label in page]
+    assert [label.split(". ", 1)[0] for label in labels] == [str(i) for i in range(1, 31)]
+    # Every recording is listed exactly once, and only video files are listed
+    paths = [path for page in pages for path, _ in page]
+    assert sorted(paths) == sorted(os.path.join(str(tmp_path), f"rec_{i:03d}.mp4") for i in range(30))
+
+def test_missing_directory_returns_empty_list(tmp_path):
+    assert list_recordings(str(tmp_path / "missing")) == []
+    assert list_recordings(None) == []
+
+def test_new_recording_is_listed(tmp_path):
+    _make_recordings(tmp_path, 1)
+    assert len(list_recordings(str(tmp_path))) == 1
+    (tmp_path / "new.webm").write_bytes(b"")
+    # The cached scan is keyed on the directory's mtime; make sure it moves
+    # even on filesystems with coarse timestamps
+    stat = os.stat(tmp_path)
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert len(list_recordings(str(tmp_path))) == 2
+
+def test_removed_directory_is_created_again(tmp_path):
+    directory = tmp_path / "recordings"
+    ensure_directories(str(directory))
+    directory.rmdir()
+    ensure_directories(str(directory))
+    assert directory.is_dir()
@@ -0,0 +1,58 @@
+import sys
+import asyncio
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+llm_cache = pytest.importorskip("src.agents.llm_cache")
+
+LLM = "model=test temperature=0"
+
+def test_evicts_least_recently_used():
+    cache = llm_cache.InMemoryLRUCache(maxsize=2)
+    cache.update("a", LLM, ["A"])
+    cache.update("b", LLM, ["B"])
+    # Looking "a" up makes "b" the least recently used entry
+    assert cache.lookup("a", LLM) == ["A"]
+    cache.update("c", LLM, ["C"])
+
+    assert cache.lookup("b", LLM) is None
+    assert cache.lookup("a", LLM) == ["A"]
+    assert cache.lookup("c", LLM) == ["C"]
+
+def test_updating_existing_entry_refreshes_it():
+    cache = llm_cache.InMemoryLRUCache(maxsize=2)
+    cache.update("a", LLM, ["A"])
+    cache.update("b", LLM, ["B"])
+    cache.update("a", LLM, ["A2"])
+    cache.update("c", LLM, ["C"])
+
+    assert cache.lookup("a", LLM) == ["A2"]
+    assert cache.lookup("b", LLM) is None
+
+def test_key_includes_model_settings():
+    cache = llm_cache.InMemoryLRUCache()
+    cache.update("a", LLM, ["A"])
+    assert cache.lookup("a", "model=other temperature=0") is None
+
+def test_stats_and_clear():
+    cache = llm_cache.InMemoryLRUCache()
+    cache.update("a", LLM, ["A"])
+    cache.lookup("a", LLM)
+    cache.lookup("missing", LLM)
+    assert cache.stats == {"hits": 1, "misses": 1}
+
+    cache.clear()
+    assert cache.lookup("a", LLM) is None
+
+def test_async_methods_share_entries():
+    async def run():
+        cache = llm_cache.InMemoryLRUCache(maxsize=1)
+        await cache.aupdate("a", LLM, ["A"])
+        hit = await cache.alookup("a", LLM)
+        await cache.aupdate("b", LLM, ["B"])
+        return hit, await cache.alookup("a", LLM)
+
+    assert asyncio.run(run()) == (["A"], None)
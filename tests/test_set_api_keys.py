@@ -0,0 +1,32 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from set_api_keys import read_assignments
+
+KEYS = ["OPENAI_API_KEY", "ANTHROPIC_API_KEY", "GOOGLE_API_KEY", "MISTRAL_API_KEY"]
+
+def test_quoted_values():
+    data = b'OPENAI_API_KEY="sk-abc123456789"\nANTHROPIC_API_KEY=\'sk-ant-123\'\n'
+    assert read_assignments(data, KEYS) == {"OPENAI_API_KEY": "sk-abc123456789", "ANTHROPIC_API_KEY": "sk-ant-123"}
+
+def test_quoted_value_with_comment():
+    data = b'OPENAI_API_KEY="sk-abc123456789" # prod\nGOOGLE_API_KEY="a #b" # note\n'
+    assert read_assignments(data, KEYS) == {"OPENAI_API_KEY": "sk-abc123456789", "GOOGLE_API_KEY": "a #b"}
+
+def test_unquoted_value_with_comment():
+    data = b'MISTRAL_API_KEY=abc#def # comment\n'
+    assert read_assignments(data, KEYS) == {"MISTRAL_API_KEY": "abc#def"}
+
+def test_export_prefix():
+    data = b'export OPENAI_API_KEY=sk-export\n  export GOOGLE_API_KEY = "g-key"\n'
+    assert read_assignments(data, KEYS) == {"OPENAI_API_KEY": "sk-export", "GOOGLE_API_KEY": "g-key"}
+
+def test_crlf_lines():
+    data = b'OPENAI_API_KEY=sk-crlf\r\nANTHROPIC_API_KEY="sk-ant" # c\r\n'
+    assert read_assignments(data, KEYS) == {"OPENAI_API_KEY": "sk-crlf", "ANTHROPIC_API_KEY": "sk-ant"}
+
+def test_comments_and_other_keys_ignored():
+    data = b'# OPENAI_API_KEY=commented\nOTHER=1\nOPENAI_API_KEY=\n'
+    assert read_assignments(data, KEYS) == {"OPENAI_API_KEY": ""}
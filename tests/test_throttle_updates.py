@@ -0,0 +1,51 @@
+import sys
+import asyncio
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+gr = pytest.importorskip("gradio")
+throttle = pytest.importorskip("src.ui.throttle")
+
+def _collect(handler, interval):
+    async def run():
+        return [update async for update in throttle.throttle_updates(handler, interval)()]
+    return asyncio.run(run())
+
+def test_merges_updates_within_interval_and_flushes_last():
+    skip = gr.skip()
+
+    async def handler():
+        yield [1, skip]
+        yield [skip, 2]
+        yield [3, skip]
+
+    # The first update goes out right away, the burst after it is merged
+    # and flushed when the handler finishes
+    assert _collect(handler, interval=60) == [[1, skip], [3, 2]]
+
+def test_spaced_updates_are_not_merged():
+    async def handler():
+        for i in range(3):
+            yield [i]
+            await asyncio.sleep(0.05)
+
+    assert _collect(handler, interval=0.01) == [[0], [1], [2]]
+
+def test_held_update_is_sent_once_due():
+    async def handler():
+        yield [1]
+        yield [2]
+        # Still running when the held update becomes due
+        await asyncio.sleep(0.2)
+        yield [3]
+
+    assert _collect(handler, interval=0.05) == [[1], [2], [3]]
+
+def test_single_update_is_sent():
+    async def handler():
+        yield ["only"]
+
+    assert _collect(handler, interval=60) == [["only"]]